@@ -1,35 +1,209 @@
 """Document classification module for the Estate PDF Organizer."""
 
+import asyncio
+import hashlib
 import json
+import math
+import pickle
+import re
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
 
+import orjson
+import tiktoken
 import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available; fall back to the pure-Python loader
+    from yaml import SafeLoader
+
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+class CacheBackend(Protocol):
+    """Storage backend for cached LLM responses."""
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent/expired."""
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value under key."""
+        ...
+
+class MemoryBackend:
+    """In-memory LRU cache backend with optional TTL expiry."""
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        """Initialize the backend.
+
+        Args:
+            max_size: Maximum number of entries before least-recently-used eviction
+            ttl: Time-to-live in seconds for each entry. If None, entries never expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value under key, evicting the least-recently-used entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+class DiskBackend:
+    """Disk-backed cache backend using diskcache, for reuse across runs."""
+
+    def __init__(self, cache_dir: Path, ttl: float | None = None):
+        """Initialize the backend.
+
+        Args:
+            cache_dir: Directory to store the cache in
+            ttl: Time-to-live in seconds for each entry. If None, entries never expire.
+
+        Raises:
+            ImportError: If the optional diskcache package is not installed
+        """
+        try:
+            import diskcache  # noqa: PLC0415 - optional dependency
+        except ImportError as err:
+            raise ImportError(
+                "DiskBackend requires the diskcache package (pip install diskcache)"
+            ) from err
+
+        self.ttl = ttl
+        self._cache = diskcache.Cache(str(cache_dir))
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None if absent/expired."""
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value under key."""
+        self._cache.set(key, value, expire=self.ttl)
+
+class LLMCache:
+    """Two-tier cache for deterministic (temperature=0) LLM responses.
+
+    The exact tier keys on a SHA-256 hash of the full request (model, messages,
+    temperature), so identical windows skip the network round-trip entirely. The
+    optional semantic tier embeds the window text and returns the cached response
+    of a previously-seen window whose embedding is sufficiently similar.
+    """
 
-@dataclass
-class ClassificationResult:
-    """Result of document classification."""
-    
     def __init__(
         self,
-        document_type: str,
-        confidence: float,
-        page_start: int,
-        page_end: int,
-        suggested_filename: str | None = None
+        backend: CacheBackend | None = None,
+        embeddings=None,
+        similarity_threshold: float = 0.97,
     ):
-        self.document_type = document_type
-        self.confidence = confidence
-        self.page_start = page_start
-        self.page_end = page_end
-        self.suggested_filename = suggested_filename
-        
-        if not 0 <= confidence <= 1:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend for exact-match entries. Defaults to MemoryBackend.
+            embeddings: Optional embeddings provider with an embed_query(text) method
+                (e.g. OpenAIEmbeddings). If None, the semantic tier is disabled.
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self._semantic_entries: list[tuple[list[float], str]] = []
+
+    @staticmethod
+    def key_for(model: str, messages: list[dict], temperature: float) -> str:
+        """Compute the exact-match cache key for a request."""
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _cosine_similarity(a: list[float], b: list[float]) -> float:
+        """Compute cosine similarity between two vectors."""
+        dot = sum(x * y for x, y in zip(a, b, strict=False))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
+
+    def get(self, key: str, text: str | None = None) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Exact-match key from key_for
+            text: Window text for the semantic tier. If None, only the exact
+                tier is consulted.
+
+        Returns:
+            Cached response content, or None on a miss
+        """
+        cached = self.backend.get(key)
+        if cached is not None:
+            return cached
+
+        if self.embeddings is None or text is None or not self._semantic_entries:
+            return None
+
+        query = self.embeddings.embed_query(text)
+        best_score, best_value = 0.0, None
+        for embedding, value in self._semantic_entries:
+            score = self._cosine_similarity(query, embedding)
+            if score > best_score:
+                best_score, best_value = score, value
+
+        if best_score > self.similarity_threshold:
+            return best_value
+        return None
+
+    def set(self, key: str, value: str, text: str | None = None) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            key: Exact-match key from key_for
+            value: Response content to cache
+            text: Window text to embed for the semantic tier
+        """
+        self.backend.set(key, value)
+        if self.embeddings is not None and text is not None:
+            self._semantic_entries.append((self.embeddings.embed_query(text), value))
+
+@dataclass(slots=True)
+class ClassificationResult:
+    """Result of document classification."""
+    document_type: str
+    confidence: float
+    page_start: int
+    page_end: int
+    suggested_filename: str | None = None
+
+    def __post_init__(self):
+        if not 0 <= self.confidence <= 1:
             raise ValueError("Confidence must be between 0 and 1")
 
 class DocumentClassifier(ABC):
@@ -38,79 +212,344 @@ class DocumentClassifier(ABC):
     @abstractmethod
     def classify(self, text: str) -> list[ClassificationResult]:
         """Classify a document based on its text content.
-        
+
         Args:
             text: The text content of the document
-            
+
         Returns:
             Classification object containing the category, suggested filename, and confidence
         """
         pass
 
+    def classify_batch(self, texts: list[str]) -> list[list[ClassificationResult]]:
+        """Classify several windows of text.
+
+        The default implementation classifies each window in turn; subclasses
+        with a cheaper bulk path (batched or concurrent requests) override it.
+
+        Args:
+            texts: Windows of text to classify
+
+        Returns:
+            One list of ClassificationResult objects per input text, in order
+        """
+        return [self.classify(text) for text in texts]
+
+# Page markers inserted by the processor's OCR text extraction
+_PAGE_MARKER_RE = re.compile(r"\[PAGE (\d+)\]")
+
+def _load_taxonomy(taxonomy_path: Path, cache_dir: Path | None = None) -> dict:
+    """Load and validate a taxonomy YAML, with an mtime-keyed pickle cache.
+
+    Repeated CLI invocations skip YAML parsing and validation entirely: the
+    validated taxonomy is pickled under a key derived from the file's resolved
+    path and mtime, so edits to the file invalidate the cache automatically.
+
+    Args:
+        taxonomy_path: Path to YAML file containing document taxonomy
+        cache_dir: Directory for cached taxonomies. Defaults to
+            ~/.cache/estate-pdf-organizer.
+
+    Returns:
+        Validated taxonomy dictionary
+
+    Raises:
+        ValueError: If the taxonomy is invalid
+    """
+    if cache_dir is None:
+        cache_dir = Path.home() / ".cache" / "estate-pdf-organizer"
+
+    cache_file = None
+    try:
+        stamp = f"{taxonomy_path.resolve()}.{taxonomy_path.stat().st_mtime_ns}"
+        cache_file = cache_dir / f"{hashlib.sha256(stamp.encode()).hexdigest()}.pkl"
+        if cache_file.exists():
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # Unreadable cache: fall through to a fresh parse
+
+    with open(taxonomy_path) as f:
+        taxonomy = yaml.load(f, Loader=SafeLoader)
+
+    if not isinstance(taxonomy, dict) or "categories" not in taxonomy:
+        raise ValueError("Taxonomy must contain categories")
+
+    if not isinstance(taxonomy["categories"], list):
+        raise ValueError("categories must be a list")
+
+    if cache_file is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(taxonomy, f)
+        except OSError:
+            pass  # Cache writes are best-effort
+
+    return taxonomy
+
+def _build_response_schema(categories: list[str]) -> dict:
+    """Build the JSON Schema enforced through OpenAI structured outputs.
+
+    Single-character field names and an integer category enum keep the output
+    sequence short: fewer generated tokens means lower latency and cost.
+
+    Args:
+        categories: Taxonomy categories; document types are returned as
+            indices into this list
+
+    Returns:
+        JSON Schema for the response object
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "documents": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "t": {"type": "integer", "enum": list(range(len(categories)))},
+                        "c": {"type": "number"},
+                        "s": {"type": "integer"},
+                        "e": {"type": "integer"},
+                        "f": {"type": ["string", "null"]},
+                    },
+                    "required": ["t", "c", "s", "e", "f"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["documents"],
+        "additionalProperties": False,
+    }
+
 class LLMClassifier:
     """Document classifier using an LLM."""
-    
-    def __init__(self, taxonomy_path: Path, api_key: str | None = None):
+
+    def __init__(
+        self,
+        taxonomy_path: Path,
+        api_key: str | None = None,
+        cache: LLMCache | None = None,
+        fast_patterns: dict[str, list[str]] | None = None,
+        max_input_tokens: int = 1500,
+        taxonomy_cache_dir: Path | None = None,
+    ):
         """Initialize the classifier.
-        
+
         Args:
             taxonomy_path: Path to YAML file containing document taxonomy
             api_key: OpenAI API key. If None, will use OPENAI_API_KEY environment variable.
+            cache: Cache for LLM responses. Defaults to an in-memory LLMCache; pass
+                a DiskBackend-based cache to reuse responses across runs.
+            fast_patterns: Mapping of category to regex patterns that classify a
+                window without an LLM call when one matches. Merged with any
+                patterns key in the taxonomy YAML.
+            max_input_tokens: Token budget for each window's text. Longer windows
+                are truncated keeping the head and tail, where boundary signal
+                concentrates.
+            taxonomy_cache_dir: Directory for the parsed-taxonomy cache.
+                Defaults to ~/.cache/estate-pdf-organizer.
         """
         # Load taxonomy
-        with open(taxonomy_path) as f:
-            taxonomy = yaml.safe_load(f)
-        
-        if not isinstance(taxonomy, dict) or "categories" not in taxonomy:
-            raise ValueError("Taxonomy must contain categories")
-        
-        if not isinstance(taxonomy["categories"], list):
-            raise ValueError("categories must be a list")
-        
+        taxonomy = _load_taxonomy(taxonomy_path, cache_dir=taxonomy_cache_dir)
+
         self.categories = taxonomy["categories"]
-        
-        # Initialize LLM
+
+        # Categories are immutable after init, so format the numbered list once
+        self._categories_block = "\n".join(
+            f"{i}. {cat}" for i, cat in enumerate(self.categories)
+        )
+
+        # Pre-compile fast-path patterns: pages with unambiguous headers (e.g.
+        # "LAST WILL AND TESTAMENT") are classified without an LLM call at all
+        patterns = dict(taxonomy.get("patterns") or {})
+        patterns.update(fast_patterns or {})
+        for category in patterns:
+            if category not in self.categories:
+                raise ValueError(f"Pattern category not in taxonomy: {category}")
+        self._fast_patterns = {
+            category: [re.compile(p, re.IGNORECASE) for p in category_patterns]
+            for category, category_patterns in patterns.items()
+        }
+
+        # Initialize LLM. langchain_openai costs over a second of import time
+        # (pydantic + tiktoken + httpx), so defer it until a classifier is
+        # actually constructed rather than taxing every CLI startup.
+        from langchain_openai import ChatOpenAI  # noqa: PLC0415
+
+        # Shared by the sync path (via model_kwargs) and the Batch API request
+        # bodies, so every path gets schema-enforced JSON output
+        self._response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "document_classifications",
+                "schema": _build_response_schema(self.categories),
+            },
+        }
+
         self.llm = ChatOpenAI(
             model="gpt-4-turbo-preview",
             temperature=0,
-            api_key=api_key
+            api_key=api_key,
+            model_kwargs={"response_format": self._response_format},
         )
-        
-        # Create prompt template
+
+        # Create prompt template. The response format is enforced by the
+        # structured-output schema, so the prompt only describes semantics.
         self.prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a document classification assistant. Your task is to analyze text 
+            ("system", """You are a document classification assistant. Your task is to analyze text
              from a number of documents which have been scanned together and determine:
 1. The boundaries of the document(s) you find
 2. What type of document each is
 3. How confident you are in your classification (0-1)
 4. A suggested filename for the document(s)
 
-Available document types:
+Available document types (by number):
 {categories}
 
-Respond with a JSON array. Each array element should be an object with:
-- document_type: The type of document (must be one of the available types)
-- confidence: A number between 0 and 1 indicating your confidence in the classification
-- page_start: The page number where the document starts
-- page_end: The page number where the document ends
-- suggested_filename: A suggested filename for the document. 
-             Please add the most relevant date if you find one
-
-Example response:
-[
-{{
-    "document_type": "Will",
-    "confidence": 0.95,
-    "page_start": 5,
-    "page_end": 6,
-    "suggested_filename": "will_glenn_meacham.pdf"
-}}]"""),
+For each document report t (the number of its document type), c (confidence
+             between 0 and 1), s and e (start and end page numbers), and f (a suggested
+             filename). Please add the most relevant date to the suggested filename
+             if you find one. List documents in ascending order of start page."""),
             ("user", "Text to analyze:\n{text}")
         ])
-        
+
+        # Pre-render the system message once: the categories never change after
+        # init, and keeping the prefix byte-identical across calls lets OpenAI's
+        # automatic prompt caching discount the repeated prompt tokens.
+        self._system_content = self.prompt.messages[0].prompt.format(
+            categories=self._categories_block
+        )
+
         # Initialize output parser
         self.parser = JsonOutputParser()
-    
+
+        # Responses are deterministic at temperature=0, so they are safe to cache
+        self.cache = cache if cache is not None else LLMCache()
+
+        # Parsed-result memo keyed on a blake2b hash of the window text alone.
+        # Overlapping sliding windows re-submit identical text many times; this
+        # tier skips even prompt formatting and response parsing on repeats.
+        self._result_cache: OrderedDict[bytes, list[ClassificationResult]] = OrderedDict()
+        self._result_cache_size = 10000
+
+        # Raw OpenAI client for the Batch API, created lazily
+        self._api_key = api_key
+        self._client = None
+
+        # Tokenizer for input truncation, created lazily on the first long window
+        self.max_input_tokens = max_input_tokens
+        self._enc = None
+
+    @property
+    def client(self) -> "OpenAI":
+        """Raw OpenAI client, created on first use."""
+        if self._client is None:
+            from openai import OpenAI  # noqa: PLC0415 - deferred heavy import
+
+            self._client = OpenAI(api_key=self._api_key)
+        return self._client
+
+    def submit_batch(self, texts: list[str]) -> str:
+        """Submit windows of text to the OpenAI Batch API.
+
+        Batch API requests run at half the price of the synchronous endpoint
+        with higher rate limits, in exchange for asynchronous completion —
+        appropriate for bulk, non-interactive runs.
+
+        Args:
+            texts: Windows of text to classify
+
+        Returns:
+            Batch ID to pass to wait_for_batch
+
+        Raises:
+            ValueError: If any text is empty
+        """
+        if any(not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        lines = []
+        for i, text in enumerate(texts):
+            formatted_prompt = self._format_prompt(text)
+            lines.append(json.dumps({
+                "custom_id": f"window_{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.llm.model_name,
+                    "messages": [
+                        {"role": "system" if m.type == "system" else "user", "content": m.content}
+                        for m in formatted_prompt
+                    ],
+                    "temperature": 0,
+                    "response_format": self._response_format,
+                },
+            }))
+
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+    ) -> list[list[ClassificationResult]]:
+        """Wait for a submitted batch to finish and parse its results.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch
+            poll_interval: Seconds to sleep between status polls
+
+        Returns:
+            One list of ClassificationResult objects per submitted text, in
+            submission order
+
+        Raises:
+            ValueError: If the batch fails or a response is invalid
+        """
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise ValueError(f"Batch {batch_id} finished with status: {batch.status}")
+            time.sleep(poll_interval)
+
+        output = self.client.files.content(batch.output_file_id).text
+
+        responses = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = int(record["custom_id"].rsplit("_", 1)[1])
+            content = record["response"]["body"]["choices"][0]["message"]["content"]
+            responses[index] = content
+
+        return [self._parse_response(responses[i]) for i in sorted(responses)]
+
+    def classify_with_batch_api(self, texts: list[str]) -> list[list[ClassificationResult]]:
+        """Classify windows of text through the OpenAI Batch API.
+
+        Args:
+            texts: Windows of text to classify
+
+        Returns:
+            One list of ClassificationResult objects per input text, in order
+        """
+        return self.wait_for_batch(self.submit_batch(texts))
+
     def classify(self, text: str) -> list[ClassificationResult]:
         """Classify a document.
         
@@ -125,21 +564,327 @@ Example response:
         """
         if not text.strip():
             raise ValueError("Text cannot be empty")
-        
-        # Format prompt
-        formatted_prompt = self.prompt.format_messages(
-            categories="\n".join(f"- {cat}" for cat in self.categories),
-            text=text
-        )
-        
+
+        # Cheapest classification is no classification: try the regex tier first
+        fast_results = self._fast_classify(text)
+        if fast_results is not None:
+            return fast_results
+
+        memoized = self._memo_get(text)
+        if memoized is not None:
+            return memoized
+
+        formatted_prompt = self._format_prompt(text)
+
+        # Check the cache before going to the network. Only deterministic
+        # (temperature=0) responses are cacheable.
+        cache_key = self._cache_key(formatted_prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key, text=text)
+            if cached is not None:
+                results = self._parse_response(cached)
+                self._memo_put(text, results)
+                return results
+
         # Get response from LLM
         response = self.llm.invoke(formatted_prompt)
-        
+
+        results = self._parse_response(response.content)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.content, text=text)
+        self._memo_put(text, results)
+
+        return results
+
+    async def aclassify(self, text: str) -> list[ClassificationResult]:
+        """Classify a document asynchronously.
+
+        The async variant lets callers overlap the network round-trips of many
+        windows (e.g. with asyncio.gather) instead of blocking on each one.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            List of ClassificationResult objects
+
+        Raises:
+            ValueError: If the text is empty or the LLM response is invalid
+        """
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        fast_results = self._fast_classify(text)
+        if fast_results is not None:
+            return fast_results
+
+        memoized = self._memo_get(text)
+        if memoized is not None:
+            return memoized
+
+        formatted_prompt = self._format_prompt(text)
+
+        cache_key = self._cache_key(formatted_prompt)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key, text=text)
+            if cached is not None:
+                results = self._parse_response(cached)
+                self._memo_put(text, results)
+                return results
+
+        response = await self.llm.ainvoke(formatted_prompt)
+
+        results = self._parse_response(response.content)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.content, text=text)
+        self._memo_put(text, results)
+
+        return results
+
+    def classify_batch(
+        self,
+        texts: list[str],
+        max_batch_size: int = 20,
+        concurrency_threshold: int = 5,
+        max_concurrency: int = 8,
+    ) -> list[list[ClassificationResult]]:
+        """Classify several windows of text in bulk.
+
+        Small batches go through the LLM's batch interface in a single pass;
+        larger batches fan out concurrently with a bounded semaphore so the
+        network round-trips overlap instead of serializing.
+
+        Args:
+            texts: Windows of text to classify
+            max_batch_size: Maximum number of prompts per batch call
+            concurrency_threshold: Batch sizes above this use concurrent requests
+            max_concurrency: Maximum number of in-flight concurrent requests
+
+        Returns:
+            One list of ClassificationResult objects per input text, in order
+
+        Raises:
+            ValueError: If any text is empty or an LLM response is invalid
+        """
+        if any(not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        results: list[list[ClassificationResult] | None] = [None] * len(texts)
+
+        # Resolve fast-path and cache hits up front so only misses hit the network
+        pending: list[tuple[int, str, list, str | None]] = []
+        for i, text in enumerate(texts):
+            fast_results = self._fast_classify(text)
+            if fast_results is not None:
+                results[i] = fast_results
+                continue
+            memoized = self._memo_get(text)
+            if memoized is not None:
+                results[i] = memoized
+                continue
+            formatted_prompt = self._format_prompt(text)
+            cache_key = self._cache_key(formatted_prompt)
+            if cache_key is not None:
+                cached = self.cache.get(cache_key, text=text)
+                if cached is not None:
+                    results[i] = self._parse_response(cached)
+                    self._memo_put(text, results[i])
+                    continue
+            pending.append((i, text, formatted_prompt, cache_key))
+
+        if pending:
+            prompts = [prompt for _, _, prompt, _ in pending]
+            if len(pending) <= concurrency_threshold:
+                responses = []
+                for batch_start in range(0, len(prompts), max_batch_size):
+                    responses.extend(self.llm.batch(prompts[batch_start:batch_start + max_batch_size]))  # noqa: E501
+            else:
+                responses = asyncio.run(self._invoke_concurrently(prompts, max_concurrency))
+
+            for (i, text, _, cache_key), response in zip(pending, responses, strict=True):
+                results[i] = self._parse_response(response.content)
+                if cache_key is not None:
+                    self.cache.set(cache_key, response.content, text=text)
+                self._memo_put(text, results[i])
+
+        return results
+
+    async def _invoke_concurrently(self, prompts: list, max_concurrency: int) -> list:
+        """Invoke the LLM concurrently over prompts with bounded concurrency.
+
+        Args:
+            prompts: Formatted prompts to send
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of LLM responses, in prompt order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def invoke_one(prompt):
+            async with semaphore:
+                return await self.llm.ainvoke(prompt)
+
+        return await asyncio.gather(*(invoke_one(prompt) for prompt in prompts))
+
+    def _memo_get(self, text: str) -> list[ClassificationResult] | None:
+        """Look up memoized results for a window text.
+
+        Args:
+            text: Window text
+
+        Returns:
+            Copy of the memoized results, or None on a miss
+        """
+        if self.llm.temperature != 0:
+            return None
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return list(cached)
+
+    def _memo_put(self, text: str, results: list[ClassificationResult]) -> None:
+        """Memoize parsed results for a window text.
+
+        Args:
+            text: Window text
+            results: Parsed classification results
+        """
+        if self.llm.temperature != 0:
+            return
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        self._result_cache[key] = list(results)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def _fast_classify(self, text: str) -> list[ClassificationResult] | None:
+        """Classify a window by regex fast-path, if an unambiguous pattern matches.
+
+        Args:
+            text: Window text, with the processor's [PAGE n] markers
+
+        Returns:
+            List with a single ClassificationResult covering the window's page
+            range, or None if no pattern matches
+        """
+        for category, patterns in self._fast_patterns.items():
+            if any(pattern.search(text) for pattern in patterns):
+                page_numbers = [int(n) for n in _PAGE_MARKER_RE.findall(text)]
+                return [ClassificationResult(
+                    document_type=category,
+                    confidence=0.99,
+                    page_start=min(page_numbers) if page_numbers else 1,
+                    page_end=max(page_numbers) if page_numbers else 1,
+                )]
+        return None
+
+    @property
+    def _encoder(self) -> tiktoken.Encoding:
+        """Tokenizer matching the LLM, created on first use."""
+        if self._enc is None:
+            try:
+                self._enc = tiktoken.encoding_for_model(self.llm.model_name)
+            except KeyError:
+                self._enc = tiktoken.get_encoding("cl100k_base")
+        return self._enc
+
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the input token budget, keeping head and tail.
+
+        Args:
+            text: Window text
+
+        Returns:
+            The text unchanged if within budget, otherwise its head and tail
+            halves joined by a truncation marker
+        """
+        # Every token is at least one character, so short text can't go over
+        # budget and doesn't need tokenizing at all
+        if len(text) <= self.max_input_tokens:
+            return text
+
+        tokens = self._encoder.encode(text)
+        if len(tokens) <= self.max_input_tokens:
+            return text
+
+        head = tokens[:self.max_input_tokens // 2]
+        tail = tokens[-(self.max_input_tokens // 2):]
+        return (
+            self._encoder.decode(head)
+            + "\n...[truncated]...\n"
+            + self._encoder.decode(tail)
+        )
+
+    def _format_prompt(self, text: str) -> list:
+        """Format the classification prompt for a window of text.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            List of formatted prompt messages
+        """
+        return [
+            SystemMessage(content=self._system_content),
+            HumanMessage(content=f"Text to analyze:\n{self._truncate(text)}"),
+        ]
+
+    def _cache_key(self, formatted_prompt: list) -> str | None:
+        """Compute the cache key for a formatted prompt, if caching applies.
+
+        Args:
+            formatted_prompt: Formatted prompt messages
+
+        Returns:
+            Cache key, or None if caching is disabled or the response is
+            non-deterministic
+        """
+        if self.cache is None or self.llm.temperature != 0:
+            return None
+        return LLMCache.key_for(
+            model=self.llm.model_name,
+            messages=[{"role": m.type, "content": m.content} for m in formatted_prompt],
+            temperature=0,
+        )
+
+    def _parse_response(self, content: str) -> list[ClassificationResult]:
+        """Parse an LLM response into classification results.
+
+        Args:
+            content: Raw response content from the LLM
+
+        Returns:
+            List of ClassificationResult objects
+
+        Raises:
+            ValueError: If the response is invalid
+        """
         try:
-            result = json.loads(response.content.replace('```json', '').replace('```', ''))
+            result = orjson.loads(content)
+            if isinstance(result, dict):
+                result = result["documents"]
 
             classification_results = []
             for r in result:
+                if "t" in r:
+                    # Compact schema: integer category index and short field names
+                    index = r["t"]
+                    if not isinstance(index, int) or not 0 <= index < len(self.categories):
+                        raise ValueError(f"Invalid document type index: {index}")
+                    classification_results.append(ClassificationResult(
+                        document_type=self.categories[index],
+                        confidence=float(r["c"]),
+                        page_start=r["s"],
+                        page_end=r["e"],
+                        suggested_filename=r.get("f")
+                    ))
+                    continue
+
                 if r["document_type"] not in self.categories:
                     raise ValueError(f"Invalid document type: {r['document_type']}")
 
@@ -152,7 +897,7 @@ Example response:
                 ))
             return classification_results
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response from LLM: {e}") from e
         except KeyError as e:
             raise ValueError(f"Missing required field in LLM response: {e}") from e
@@ -4,9 +4,6 @@ import argparse
 import os
 from pathlib import Path
 
-from .classifier import LLMClassifier
-from .processor import EstatePDFProcessor
-
 
 def main():
     """Main entry point for the CLI."""
@@ -51,6 +48,19 @@ def main():
         help="Show what would be done without making changes"
     )
     
+    parser.add_argument(
+        "--remove-blank-pages",
+        action="store_true",
+        help="Drop blank pages instead of collecting them into Unorganized documents"
+    )
+
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Classify through the OpenAI Batch API (half price, asynchronous). "
+             "Best for bulk runs where latency doesn't matter."
+    )
+
     parser.add_argument(
         "--window-size",
         type=int,
@@ -70,7 +80,12 @@ def main():
     
     # Create output directory if it doesn't exist
     args.output_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    # Deferred so that --help and argument errors don't pay the >1s import
+    # cost of the LLM and PDF stacks
+    from .classifier import LLMClassifier  # noqa: PLC0415
+    from .processor import EstatePDFProcessor  # noqa: PLC0415
+
     # Initialize the processor
     classifier = LLMClassifier(args.taxonomy, api_key=api_key)
     processor = EstatePDFProcessor(
@@ -79,7 +94,9 @@ def main():
         classifier=classifier,
         overwrite=args.overwrite,
         dry_run=args.dry_run,
-        window_size=args.window_size
+        window_size=args.window_size,
+        use_batch_api=args.batch_api,
+        remove_blank_pages=args.remove_blank_pages
     )
     
     # Process the PDFs
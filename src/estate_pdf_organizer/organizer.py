@@ -1,14 +1,84 @@
 """File organization module for the Estate PDF Organizer."""
 
+import mmap
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 
+import orjson
 import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available; fall back to the pure-Python dumper
+    from yaml import SafeDumper
+
 from pypdf import PdfReader, PdfWriter
 
+try:
+    import pymupdf
+except ImportError:  # fall back to the pure-Python pypdf write path
+    pymupdf = None
+
+# Per-worker-process source caches: workers persist across pool jobs, so each
+# source PDF is parsed once per worker instead of once per extracted document
+_WORKER_READER_CACHE: dict[str, PdfReader] = {}
+_WORKER_DOC_CACHE: dict[str, object] = {}
+
+def _worker_get_reader(source_pdf_path: str) -> PdfReader:
+    """Get this worker process's cached reader for a source PDF.
+
+    Args:
+        source_pdf_path: Path to the source PDF
+
+    Returns:
+        Cached PdfReader instance for the file
+    """
+    reader = _WORKER_READER_CACHE.get(source_pdf_path)
+    if reader is None:
+        reader = _WORKER_READER_CACHE[source_pdf_path] = PdfReader(
+            source_pdf_path, strict=False
+        )
+    return reader
 
-@dataclass
+def _write_document(source_pdf_path: str, start_page: int, end_page: int,
+                    output_path: str) -> None:
+    """Write one extracted page range to its own output PDF.
+
+    Extraction goes through pymupdf's C-backed insert_pdf when available,
+    which is far faster than pypdf's pure-Python object copying; pypdf is
+    kept as the fallback. Module-level so it can be pickled into worker
+    processes; only the path and page indices cross the pipe, never reader
+    or page objects.
+
+    Args:
+        source_pdf_path: Path to the source PDF
+        start_page: First page to extract (1-based)
+        end_page: Last page to extract (1-based)
+        output_path: Path to write the output PDF to
+    """
+    if pymupdf is not None:
+        doc = _WORKER_DOC_CACHE.get(source_pdf_path)
+        if doc is None:
+            doc = _WORKER_DOC_CACHE[source_pdf_path] = pymupdf.open(source_pdf_path)
+        out = pymupdf.open()
+        out.insert_pdf(doc, from_page=start_page - 1, to_page=end_page - 1)
+        out.save(output_path, deflate=True)
+        out.close()
+        return
+
+    reader = _worker_get_reader(source_pdf_path)
+    writer = PdfWriter()
+    writer.append(reader, pages=(start_page - 1, end_page))
+    # Serialize to memory first so the file lands in one write syscall
+    buffer = BytesIO()
+    writer.write(buffer)
+    Path(output_path).write_bytes(buffer.getbuffer())
+
+@dataclass(slots=True)
 class DocumentMetadata:
     """Metadata for a document."""
     source_pdf: str
@@ -22,23 +92,49 @@ class DocumentMetadata:
 class DocumentOrganizer:
     """Organizes documents into categories."""
     
-    def __init__(self, output_dir: Path, overwrite: bool = False):
+    def __init__(self, output_dir: Path, overwrite: bool = False,
+                 taxonomy_categories: list[str] | None = None):
         """Initialize the document organizer.
-        
+
         Args:
             output_dir: Directory to store organized documents
             overwrite: Whether to overwrite existing files
+            taxonomy_categories: Known category names. When given, all category
+                directories are created up front so organize_document skips the
+                per-call mkdir.
         """
         self.output_dir = output_dir
         self.overwrite = overwrite
         self.metadata = []
-        self.unprocessed_pages = {}  # Track unprocessed pages by source PDF
+        # Unprocessed pages per source PDF, packed into int bitmasks (bit p-1
+        # set means page p is unprocessed): 1 bit per page instead of ~28
+        # bytes per list entry, with O(1) bitwise set operations
+        self.unprocessed_pages = {}
+        self._reader_cache = {}  # Parsed PdfReader instances by source path
+        self._pages_cache = {}  # Materialized page lists by source path
+        self._mmap_cache = {}  # Memory-mapped source files backing the readers
+        # Append-only JSONL log, one line per organized document: O(1) per
+        # write and crash-safe, unlike re-serializing the whole metadata list
+        self._metadata_log = output_dir / "metadata.jsonl"
+        # Known filenames per category directory: one os.scandir when a
+        # category is first used, then set lookups instead of per-range
+        # stat calls; names we assign are added so they stay reserved even
+        # before (or without, in dry runs) the file being written
+        self._dir_names: dict[str, set] = {}
+        # Guards shared mutable state (filename reservations, metadata, source
+        # caches) when worker threads share one organizer. Reentrant because
+        # the pages cache fills through the reader cache under the same lock.
+        self._lock = threading.RLock()
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create Unorganized directory
-        (self.output_dir / "Unorganized").mkdir(exist_ok=True)
+
+        # Create all known category directories once up front; anything not
+        # known yet falls back to a one-time mkdir in organize_document
+        self._created_dirs: set[str] = {"Unorganized"}
+        self._created_dirs.update(taxonomy_categories or ())
+        for name in self._created_dirs:
+            (self.output_dir / name).mkdir(exist_ok=True)
     
     def add_document(self, metadata: DocumentMetadata) -> None:
         """Add a document to be organized.
@@ -46,17 +142,108 @@ class DocumentOrganizer:
         Args:
             metadata: Document metadata
         """
-        self.metadata.append(metadata)
-    
+        with self._lock:
+            self.metadata.append(metadata)
+
     def add_unprocessed_pages(self, source_pdf: str, pages: list[int]) -> None:
         """Add unprocessed pages to the metadata.
-        
+
         Args:
             source_pdf: Path to the source PDF
             pages: List of unprocessed page numbers
         """
-        self.unprocessed_pages[source_pdf] = pages
+        mask = 0
+        for page in pages:
+            mask |= 1 << (page - 1)
+        with self._lock:
+            self.unprocessed_pages[source_pdf] = mask
+
+    @staticmethod
+    def _mask_to_pages(mask: int) -> list[int]:
+        """Expand a page bitmask back into a sorted list of page numbers.
+
+        Args:
+            mask: Bitmask with bit p-1 set for each page p
+
+        Returns:
+            Sorted list of 1-based page numbers
+        """
+        pages = []
+        page = 1
+        while mask:
+            if mask & 1:
+                pages.append(page)
+            mask >>= 1
+            page += 1
+        return pages
     
+    def _get_reader(self, path: str) -> PdfReader:
+        """Get a PdfReader for a source PDF, parsing each file at most once.
+
+        The source is memory-mapped rather than read through buffered I/O, so
+        the OS pages object data in on demand and the resident footprint is
+        the working set, not the file size.
+
+        Args:
+            path: Path to the source PDF
+
+        Returns:
+            Cached PdfReader instance for the file
+        """
+        with self._lock:
+            if path not in self._reader_cache:
+                with open(path, 'rb') as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._mmap_cache[path] = mm
+                self._reader_cache[path] = PdfReader(mm, strict=False)
+            return self._reader_cache[path]
+
+    def _get_pages(self, path: str) -> list:
+        """Get the materialized page list for a source PDF.
+
+        pypdf resolves pages through lazy __getitem__ dispatch; materializing
+        the list once per source turns repeated page access into plain list
+        indexing and slicing.
+
+        Args:
+            path: Path to the source PDF
+
+        Returns:
+            List of page objects for the file
+        """
+        with self._lock:
+            if path not in self._pages_cache:
+                self._pages_cache[path] = list(self._get_reader(path).pages)
+            return self._pages_cache[path]
+
+    def close(self) -> None:
+        """Release any cached source PDF readers and their mappings."""
+        for reader in self._reader_cache.values():
+            reader.close()
+        for mm in self._mmap_cache.values():
+            mm.close()
+        self._reader_cache.clear()
+        self._pages_cache.clear()
+        self._mmap_cache.clear()
+
+    def append_metadata(self, metadata: DocumentMetadata) -> None:
+        """Append one document's metadata to the JSONL log.
+
+        Args:
+            metadata: Document metadata to record
+        """
+        record = {
+            "source_pdf": metadata.source_pdf,
+            "start_page": metadata.start_page,
+            "end_page": metadata.end_page,
+            "document_type": metadata.document_type,
+            "filename": metadata.filename,
+            "confidence": metadata.confidence,
+            "output_path": metadata.output_path,
+        }
+        with self._lock, open(self._metadata_log, 'ab') as f:
+            f.write(orjson.dumps(record) + b"\n")
+
     def _get_unique_filename(self, category_dir: Path, base_filename: str) -> str:
         """Generate a unique filename by appending a number if needed.
         
@@ -67,82 +254,124 @@ class DocumentOrganizer:
         Returns:
             Unique filename that doesn't exist in the directory
         """
-        if not (category_dir / base_filename).exists():
-            return base_filename
-            
-        # Split filename into name and extension
-        name, ext = os.path.splitext(base_filename)
-        
-        # Try appending numbers until we find a unique filename
-        counter = 1
-        while True:
-            new_filename = f"{name}_{counter}{ext}"
-            if not (category_dir / new_filename).exists():
-                return new_filename
-            counter += 1
+        # One directory listing per category for the organizer's lifetime,
+        # then pure set lookups. The lock makes the check-then-reserve atomic
+        # when worker threads share this organizer.
+        with self._lock:
+            existing = self._dir_names.get(str(category_dir))
+            if existing is None:
+                existing = {entry.name for entry in os.scandir(category_dir)}
+                self._dir_names[str(category_dir)] = existing
+
+            if base_filename not in existing:
+                existing.add(base_filename)
+                return base_filename
+
+            # Split filename into name and extension
+            name, ext = os.path.splitext(base_filename)
+
+            # Try appending numbers until we find a unique filename
+            counter = 1
+            while True:
+                new_filename = f"{name}_{counter}{ext}"
+                if new_filename not in existing:
+                    existing.add(new_filename)
+                    return new_filename
+                counter += 1
+
+    @staticmethod
+    def _validate_page_range(total_pages: int, start_page: int, end_page: int) -> None:
+        """Validate a 1-based page range against a PDF's page count.
+
+        Args:
+            total_pages: Total number of pages in the source PDF
+            start_page: First page of the range (1-based)
+            end_page: Last page of the range (1-based)
+
+        Raises:
+            ValueError: If the page range is invalid
+        """
+        # Single combined check on the happy path; the specific error is only
+        # worked out once the range is already known to be bad
+        if 1 <= start_page <= end_page <= total_pages:
+            return
+        if start_page < 1:
+            raise ValueError("Start page must be at least 1")
+        if end_page > total_pages:
+            raise ValueError(f"End page {end_page} exceeds total pages ({total_pages})")
+        raise ValueError(f"Start page {start_page} is greater than end page {end_page}")
 
     def organize_document(
         self,
-        pdf_reader: PdfReader,
         source_pdf_path: str,
         start_page: int,
         end_page: int,
         document_type: str,
+        pdf_reader: PdfReader | None = None,
         dry_run: bool = False,
         suggested_filename: str | None = None,
+        total_pages: int | None = None,
     ) -> DocumentMetadata:
         """Organize a single document by extracting specified page range.
-        
+
         Args:
-            pdf_reader: Already opened PDF reader instance
-            source_pdf_path: Path to the source PDF file (for metadata)
+            source_pdf_path: Path to the source PDF file
             start_page: First page to extract (1-based)
             end_page: Last page to extract (1-based)
             document_type: Type of document (e.g., "will", "trust", "deed")
+            pdf_reader: Already opened PDF reader instance. If None, the source
+                is opened (at most once per run) from source_pdf_path.
             dry_run: If True, only return metadata without creating files
             suggested_filename: Optional filename suggested by the classifier
-            
+            total_pages: Known page count of the source. Skips the page-tree
+                walk that len(reader.pages) costs when the caller already has
+                the count.
+
         Returns:
             DocumentMetadata object for the extracted document
-            
+
         Raises:
             ValueError: If page range is invalid or output file exists
         """
-        # Validate page range
-        total_pages = len(pdf_reader.pages)
-        if start_page < 1:
-            raise ValueError("Start page must be at least 1")
-        if end_page > total_pages:
-            raise ValueError(f"End page {end_page} exceeds total pages ({total_pages})")
-        if start_page > end_page:
-            raise ValueError(f"Start page {start_page} is greater than end page {end_page}")
-        
-        # Create output filename
+        if pdf_reader is None:
+            pdf_reader = self._get_reader(source_pdf_path)
+            if total_pages is None:
+                total_pages = len(self._get_pages(source_pdf_path))
+        else:
+            # Seed the cache so later calls without an explicit reader reuse
+            # this parse instead of reopening the source
+            self._reader_cache.setdefault(source_pdf_path, pdf_reader)
+            if total_pages is None:
+                # Goes through the pages cache so repeat calls against the
+                # same source validate without re-walking the page tree
+                total_pages = len(self._get_pages(source_pdf_path))
+
+        self._validate_page_range(total_pages, start_page, end_page)
+
+        # Create output filename; Path.stem avoids the basename/splitext pair
         if suggested_filename:
             output_filename = suggested_filename
         else:
-            base = os.path.splitext(os.path.basename(source_pdf_path))[0]
-            output_filename = f"{base}_pages_{start_page}-{end_page}.pdf"
+            output_filename = (
+                f"{Path(source_pdf_path).stem}_pages_{start_page}-{end_page}.pdf"
+            )
         
-        # Create output path in the appropriate category directory
+        # Create output path in the appropriate category directory; known
+        # categories were created in __init__, so mkdir only on first sight
         category_dir = self.output_dir / document_type
-        category_dir.mkdir(exist_ok=True)
-        
+        with self._lock:
+            if document_type not in self._created_dirs:
+                category_dir.mkdir(exist_ok=True)
+                self._created_dirs.add(document_type)
+
         # Get unique filename
         output_filename = self._get_unique_filename(category_dir, output_filename)
         output_path = category_dir / output_filename
         
-        # Create output PDF
-        pdf_writer = PdfWriter()
-        
-        # Add pages to the new PDF (0-based indexing)
-        for page_num in range(start_page - 1, end_page):
-            pdf_writer.add_page(pdf_reader.pages[page_num])
-        
-        # Save the new PDF if not in dry run mode
+        # Save the new PDF if not in dry run mode; _write_document picks the
+        # pymupdf fast path when available and falls back to pypdf
         if not dry_run:
-            with open(output_path, 'wb') as output_file:
-                pdf_writer.write(output_file)
+            _write_document(source_pdf_path, start_page, end_page, str(output_path))
         
         # Create metadata
         doc_metadata = DocumentMetadata(
@@ -155,11 +384,93 @@ class DocumentOrganizer:
             output_path=str(output_path)
         )
         
-        # Add to internal tracking
-        self.metadata.append(doc_metadata)
-        
+        # Add to internal tracking; one lock scope keeps the list and the
+        # JSONL log in the same order
+        with self._lock:
+            self.metadata.append(doc_metadata)
+            if not dry_run:
+                self.append_metadata(doc_metadata)
+
         return doc_metadata
     
+    def organize_all(
+        self,
+        tasks: list[tuple],
+        dry_run: bool = False,
+        max_workers: int | None = None,
+    ) -> list[DocumentMetadata]:
+        """Organize many documents, writing the output PDFs in parallel.
+
+        Writing distinct output PDFs is embarrassingly parallel, so the writes
+        are fanned out to a process pool while validation, filename assignment,
+        and metadata stay on the main process.
+
+        Args:
+            tasks: Tuples of (source_pdf_path, start_page, end_page,
+                document_type, suggested_filename)
+            dry_run: If True, only return metadata without creating files
+            max_workers: Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            DocumentMetadata objects for the extracted documents, in task order
+
+        Raises:
+            ValueError: If any page range is invalid
+        """
+        stems: dict[str, str] = {}  # Source stem computed once per distinct path
+        jobs = []
+        results = []
+
+        for source_pdf_path, start_page, end_page, document_type, suggested_filename in tasks:
+            self._validate_page_range(
+                len(self._get_pages(source_pdf_path)), start_page, end_page
+            )
+
+            if suggested_filename:
+                output_filename = suggested_filename
+            else:
+                stem = stems.get(source_pdf_path)
+                if stem is None:
+                    stem = stems[source_pdf_path] = Path(source_pdf_path).stem
+                output_filename = f"{stem}_pages_{start_page}-{end_page}.pdf"
+
+            category_dir = self.output_dir / document_type
+            with self._lock:
+                if document_type not in self._created_dirs:
+                    category_dir.mkdir(exist_ok=True)
+                    self._created_dirs.add(document_type)
+
+            # The listing cache reserves each assigned name, so earlier tasks
+            # in this batch collide correctly even before anything is written
+            output_filename = self._get_unique_filename(category_dir, output_filename)
+            output_path = category_dir / output_filename
+
+            doc_metadata = DocumentMetadata(
+                source_pdf=source_pdf_path,
+                start_page=start_page,
+                end_page=end_page,
+                document_type=document_type,
+                filename=output_filename,
+                confidence=1.0,
+                output_path=str(output_path)
+            )
+            with self._lock:
+                self.metadata.append(doc_metadata)
+                if not dry_run:
+                    self.append_metadata(doc_metadata)
+            results.append(doc_metadata)
+
+            if not dry_run:
+                jobs.append((source_pdf_path, start_page, end_page, str(output_path)))
+
+        if jobs:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_write_document, *job) for job in jobs]
+                for future in futures:
+                    future.result()
+
+        return results
+
     def save_metadata(self, output_path: Path) -> None:
         """Save metadata to a YAML file.
         
@@ -180,10 +491,16 @@ class DocumentOrganizer:
                 for doc in self.metadata
             ],
             "unprocessed_pages": {
-                source_pdf: pages
-                for source_pdf, pages in self.unprocessed_pages.items()
+                source_pdf: self._mask_to_pages(mask)
+                for source_pdf, mask in self.unprocessed_pages.items()
             }
         }
         
         with open(output_path, 'w') as f:
-            yaml.dump(metadata, f, default_flow_style=False) 
\ No newline at end of file
+            yaml.dump(metadata, f, Dumper=SafeDumper, default_flow_style=False,
+                      sort_keys=False)
+
+        # Also emit a JSON mirror for downstream tooling; orjson serializes
+        # large metadata sets far faster than PyYAML
+        json_path = output_path.with_suffix('.json')
+        json_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2)) 
\ No newline at end of file
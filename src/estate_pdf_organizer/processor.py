@@ -1,14 +1,22 @@
 """Main processor module for the Estate PDF Organizer."""
 
+import hashlib
 import logging
+import os
+import re
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import pairwise
 from pathlib import Path
 
 import pytesseract
 from pdf2image import convert_from_path
+from PIL import Image, ImageStat
 from pypdf import PdfReader
 
 from .classifier import DocumentClassifier
-from .organizer import DocumentOrganizer
+from .organizer import DocumentMetadata, DocumentOrganizer
 
 # Configure logging
 logging.basicConfig(
@@ -17,43 +25,340 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def read_pdf(pdf_path: Path) -> tuple[PdfReader, int, list]:
+# Matches pages whose text is only whitespace, punctuation, or OCR noise
+_BLANK_RE = re.compile(r"\A[\s\W_]*\Z")
+
+def is_blank_page(text: str) -> bool:
+    """Check whether a page's extracted text indicates a blank page.
+
+    Args:
+        text: Text extracted from the page (OCR or embedded text layer)
+
+    Returns:
+        True if the page contains no meaningful text
+    """
+    return _BLANK_RE.match(text) is not None
+
+# Grayscale stddev thresholds for pixel-based blank detection: below the
+# first a page is uniformly blank; above the second it clearly has content.
+# Pages in between are ambiguous (faint scans, bleed-through) and need OCR.
+_BLANK_STD_LOW = 3.0
+_BLANK_STD_HIGH = 8.0
+
+def page_pixel_stddev(page_image) -> float:
+    """Measure a page image's pixel variation on a small grayscale thumbnail.
+
+    Blank pages are nearly uniform, so their standard deviation is close to
+    zero; deciding this from a 64x64 thumbnail takes well under a millisecond
+    versus hundreds for OCR.
+
+    Args:
+        page_image: PIL Image object of the page
+
+    Returns:
+        Standard deviation of the thumbnail's grayscale pixel values
+    """
+    thumb = page_image.convert("L").resize((64, 64), Image.NEAREST)
+    return ImageStat.Stat(thumb).stddev[0]
+
+class LazyPageImages:
+    """Page images for a PDF, rendered on demand.
+
+    With PyMuPDF installed, each page is rasterized only when first accessed,
+    so a large PDF never holds every page image in memory at once. Without it,
+    falls back to pdf2image, rasterizing poppler batches of pages on demand
+    instead of the whole document up front.
+    """
+
+    # Pages per poppler invocation in the pdf2image fallback: large enough to
+    # amortize process startup, small enough to keep resident memory flat
+    _FALLBACK_BATCH = 50
+
+    def __init__(self, pdf_path: Path, dpi: int = 150, page_count: int | None = None,
+                 grayscale: bool = True):
+        """Initialize the renderer.
+
+        Args:
+            pdf_path: Path to the PDF file
+            dpi: Resolution to render pages at. 150 is plenty for OCR and
+                feeds Tesseract a quarter of the pixels 300 would
+            page_count: Known page count; saves the fallback from parsing the
+                PDF a second time when the caller already has a reader open
+            grayscale: Render single-channel instead of RGB, cutting pixel
+                bandwidth 3x with no OCR accuracy cost on document scans
+        """
+        self.dpi = dpi
+        self.grayscale = grayscale
+        self._pdf_path = pdf_path
+        try:
+            import pymupdf  # noqa: PLC0415 - optional dependency
+
+            self._pymupdf = pymupdf
+            self._doc = pymupdf.open(pdf_path)
+            self._count = self._doc.page_count
+            self._images = None
+        except ImportError:
+            self._doc = None
+            # Images stay unrendered until a batch is requested
+            if page_count is None:
+                page_count = len(PdfReader(pdf_path, strict=False).pages)
+            self._count = page_count
+            self._images = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int):
+        """Render a page image (0-based index)."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Page index out of range: {index}")
+        if self._doc is None:
+            if index not in self._images:
+                # Render the whole surrounding batch in one poppler call and
+                # drop any earlier batch so memory stays bounded
+                batch_start = (index // self._FALLBACK_BATCH) * self._FALLBACK_BATCH
+                batch_end = min(batch_start + self._FALLBACK_BATCH, self._count)
+                # thread_count parallelizes poppler across cores, but only
+                # takes effect with an output_folder to shard pages into
+                with tempfile.TemporaryDirectory() as render_dir:
+                    rendered = convert_from_path(
+                        self._pdf_path,
+                        dpi=self.dpi,
+                        grayscale=self.grayscale,
+                        first_page=batch_start + 1,
+                        last_page=batch_end,
+                        thread_count=max(1, (os.cpu_count() or 2) - 1),
+                        output_folder=render_dir,
+                    )
+                    rendered = [img.copy() for img in rendered]
+                self._images = dict(zip(range(batch_start, batch_end), rendered,
+                                        strict=True))
+            return self._images[index]
+        colorspace = self._pymupdf.csGRAY if self.grayscale else self._pymupdf.csRGB
+        return self._doc.load_page(index).get_pixmap(
+            dpi=self.dpi, colorspace=colorspace
+        ).pil_image()
+
+    def embedded_text(self, index: int) -> str | None:
+        """Extract a page's embedded text layer, if one can be read cheaply.
+
+        PyMuPDF reads the text layer directly from the content stream, orders
+        of magnitude faster than rasterizing and OCRing the page. Scan-only
+        pages return an empty string; in the pdf2image fallback (no PyMuPDF)
+        this returns None and callers should OCR.
+
+        Args:
+            index: Page index (0-based)
+
+        Returns:
+            The page's text layer, or None when unavailable
+        """
+        if self._doc is None:
+            return None
+        return self._doc.load_page(index).get_text("text")
+
+def read_pdf(pdf_path: Path, dpi: int = 150,
+             grayscale: bool = True) -> tuple[PdfReader, int, LazyPageImages]:
     """Read a PDF file and return its reader, page count, and page images.
-    
+
     Args:
         pdf_path: Path to the PDF file
-        
+        dpi: Resolution to render page images at
+        grayscale: Render single-channel page images
+
     Returns:
         Tuple of (PdfReader, total_pages, page_images)
-        
+
     Raises:
         FileNotFoundError: If the PDF file doesn't exist
         ValueError: If the PDF is invalid
     """
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-        
+
     try:
         reader = PdfReader(pdf_path)
-        # Convert PDF to images for OCR
-        images = convert_from_path(pdf_path)
-        return reader, len(reader.pages), images
+        total_pages = len(reader.pages)
+        # Page images for OCR, rendered lazily; hand over the page count so
+        # the fallback path doesn't reparse the file
+        images = LazyPageImages(pdf_path, dpi=dpi, page_count=total_pages,
+                                grayscale=grayscale)
+        return reader, total_pages, images
     except Exception as err:
         raise ValueError(f"Error reading PDF {pdf_path}: {err!s}") from err
 
-def extract_text_from_page(page_image) -> str:
+# Binarization threshold and the minimum grayscale stddev for it to be safe;
+# low-contrast scans lose faint strokes to a hard threshold, so they stay gray
+_BINARIZE_THRESHOLD = 155
+_BINARIZE_MIN_STD = 40.0
+
+def binarize_for_ocr(page_image):
+    """Reduce a page image to 1-bit for Tesseract when quality permits.
+
+    Tesseract binarizes internally anyway; doing it up front skips that pass
+    and feeds it a buffer 24x smaller than RGB. Poor-contrast pages fall back
+    to grayscale so faint strokes aren't thresholded away.
+
+    Args:
+        page_image: PIL Image object of the page
+
+    Returns:
+        1-bit image, or the grayscale image for low-contrast scans
+    """
+    if page_image.mode == "1":
+        return page_image
+    gray = page_image if page_image.mode == "L" else page_image.convert("L")
+    if ImageStat.Stat(gray).stddev[0] < _BINARIZE_MIN_STD:
+        return gray
+    return gray.point(lambda x: 0 if x < _BINARIZE_THRESHOLD else 255, '1')
+
+def page_image_cache_key(page_image, salt: bytes) -> str:
+    """Compute a stable cache key for a page image's OCR result.
+
+    Args:
+        page_image: PIL Image object of the page
+        salt: Bytes identifying the OCR configuration, so results from a
+            different engine or config never collide
+
+    Returns:
+        Hex digest keying this image + configuration pair
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{page_image.mode}|{page_image.size}|".encode())
+    digest.update(page_image.tobytes())
+    digest.update(salt)
+    return digest.hexdigest()
+
+# Persistent in-process Tesseract API (tesserocr), created lazily per
+# process. False means tesserocr is not installed and pytesseract is used.
+_tess_api = None
+
+def _get_tess_api():
+    """Get the persistent tesserocr API for this process, if available.
+
+    tesserocr keeps libtesseract and its language models loaded in-process,
+    so each page skips the process spawn and model reload that a pytesseract
+    call pays. Pool workers each initialize their own instance on first use.
+
+    Returns:
+        PyTessBaseAPI instance, or None when tesserocr isn't installed
+    """
+    global _tess_api  # noqa: PLW0603 - per-process singleton
+    if _tess_api is None:
+        try:
+            from tesserocr import OEM, PSM, PyTessBaseAPI  # noqa: PLC0415
+
+            _tess_api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY, lang='eng')
+        except ImportError:
+            _tess_api = False
+    return _tess_api or None
+
+def extract_text_from_page(page_image, oem: int = 1, psm: int = 6) -> str:
     """Extract text from a page image using OCR.
-    
+
     Args:
         page_image: PIL Image object of the page
-        
+        oem: Tesseract engine mode. 1 (LSTM only) skips the legacy engine
+            that --oem 3 also runs; use 3 for both engines
+        psm: Page segmentation mode. 6 assumes a uniform text block; 4 suits
+            single-column forms and letters
+
     Returns:
         Extracted text from the page
     """
-    # Configure Tesseract to use English language and optimize for document text
-    custom_config = r'--oem 3 --psm 6 -l eng'
+    page_image = binarize_for_ocr(page_image)
+
+    api = _get_tess_api()
+    if api is not None:
+        api.SetImage(page_image)
+        return api.GetUTF8Text()
+
+    custom_config = f'--oem {oem} --psm {psm} -l eng'
     return pytesseract.image_to_string(page_image, config=custom_config)
 
+# Minimum characters for an embedded text layer to be trusted over OCR;
+# below this the page is likely a scan with stray artifacts
+_MIN_TEXT_LAYER_CHARS = 40
+
+def text_layer_usable(text: str | None) -> bool:
+    """Decide whether an embedded text layer is good enough to skip OCR.
+
+    Args:
+        text: Text extracted from the page's content stream, or None
+
+    Returns:
+        True if the layer is substantial and not mostly garbled
+    """
+    if not text:
+        return False
+    stripped = text.strip()
+    if len(stripped) < _MIN_TEXT_LAYER_CHARS:
+        return False
+    compact = stripped.replace(" ", "").replace("\n", "")
+    alnum = sum(c.isalnum() for c in compact)
+    return alnum >= len(compact) / 2
+
+# Pages stacked per Tesseract invocation: each call pays process spawn and
+# model load, so batching 8 pages cuts that overhead 8x
+_OCR_STRIP_SIZE = 8
+# White gap between stacked pages, so line detection never merges them
+_OCR_STRIP_GAP = 50
+
+def extract_text_from_page_strip(page_images: list) -> list[str]:
+    """Extract text from several pages with a single Tesseract invocation.
+
+    The pages are stacked into one tall image and OCR'd together, then the
+    recognized words are routed back to their source page by their vertical
+    position. One process spawn and model load covers the whole strip.
+
+    Args:
+        page_images: PIL Image objects of consecutive pages
+
+    Returns:
+        Extracted text for each page, in input order
+    """
+    if not page_images:
+        return []
+    if len(page_images) == 1:
+        return [extract_text_from_page(page_images[0])]
+
+    width = max(img.width for img in page_images)
+    height = sum(img.height for img in page_images) + _OCR_STRIP_GAP * (len(page_images) - 1)
+    # Single-channel canvas when every page is already gray/1-bit; only mixed
+    # or color inputs pay for an RGB strip
+    mode = "L" if all(img.mode in ("1", "L") for img in page_images) else "RGB"
+    strip = Image.new(mode, (width, height), "white")
+    offsets = []  # Top y coordinate of each page within the strip
+    y = 0
+    for img in page_images:
+        strip.paste(img, (0, y))
+        offsets.append(y)
+        y += img.height + _OCR_STRIP_GAP
+
+    custom_config = r'--oem 1 --psm 6 -l eng'
+    data = pytesseract.image_to_data(
+        binarize_for_ocr(strip), config=custom_config, output_type=pytesseract.Output.DICT
+    )
+
+    # Rebuild per-page text: group words into lines, lines into pages
+    lines: dict[tuple, list[str]] = {}
+    for i, word in enumerate(data["text"]):
+        if not word.strip():
+            continue
+        top = data["top"][i]
+        page_idx = len(offsets) - 1
+        while page_idx > 0 and top < offsets[page_idx]:
+            page_idx -= 1
+        line_key = (page_idx, data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines.setdefault(line_key, []).append(word)
+
+    texts = [[] for _ in page_images]
+    for line_key in sorted(lines):
+        texts[line_key[0]].append(" ".join(lines[line_key]))
+    return ["\n".join(page_lines) for page_lines in texts]
+
 def extract_text_from_pages(images: list, start_page: int, end_page: int) -> str:
     """Extract text from a range of pages using OCR.
     
@@ -81,7 +386,7 @@ def extract_text_from_pages(images: list, start_page: int, end_page: int) -> str
 class EstatePDFProcessor:
     """Main processor for organizing estate documents."""
     
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917 - processor options are flat by design
         self,
         input_dir: Path,
         output_dir: Path,
@@ -89,9 +394,16 @@ class EstatePDFProcessor:
         overwrite: bool = False,
         dry_run: bool = False,
         window_size: int = 10,
+        use_batch_api: bool = False,
+        remove_blank_pages: bool = False,
+        ocr_workers: int | None = None,
+        pdf_workers: int = 1,
+        ocr_backend: str = "tesseract",
+        dpi: int = 150,
+        grayscale: bool = True,
     ):
         """Initialize the processor.
-        
+
         Args:
             input_dir: Directory containing input PDFs
             output_dir: Directory to store organized documents
@@ -99,110 +411,449 @@ class EstatePDFProcessor:
             overwrite: Whether to overwrite existing files
             dry_run: If True, only show what would be done without making changes
             window_size: Number of pages to consider for document boundary detection
+            use_batch_api: If True, classify fixed non-overlapping windows through the
+                classifier's Batch API support instead of the adaptive sliding window.
+                Cheaper for bulk runs, at the cost of coarser boundary detection.
+            remove_blank_pages: If True, drop blank pages instead of collecting
+                them into Unorganized documents
+            ocr_workers: Number of worker processes for OCR. Defaults to the
+                OCR_CONCURRENCY environment variable, then the CPU count;
+                pass 1 to OCR pages lazily on a single core.
+            pdf_workers: Number of PDFs to process concurrently in
+                process_directory. Independent files overlap one file's LLM
+                wait time with another's OCR.
+            ocr_backend: "tesseract" (default) or "easyocr". EasyOCR batches
+                page images through a CUDA model when one is available; falls
+                back to Tesseract if easyocr isn't installed or no GPU exists.
+            dpi: Resolution to render page images at for OCR
+            grayscale: Render single-channel page images for OCR
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
         self.overwrite = overwrite
         self.dry_run = dry_run
         self.window_size = window_size
-        
+        self.use_batch_api = use_batch_api
+        self.remove_blank_pages = remove_blank_pages
+        if ocr_workers is None and os.environ.get("OCR_CONCURRENCY"):
+            ocr_workers = int(os.environ["OCR_CONCURRENCY"])
+        self.ocr_workers = ocr_workers
+        self.pdf_workers = pdf_workers
+        self.ocr_backend = ocr_backend
+        self.dpi = dpi
+        self.grayscale = grayscale
+        self._easyocr_reader = None
+
+        # On-disk OCR cache keyed by page-image hash: re-runs after a partial
+        # failure, and boilerplate pages shared between estate PDFs (cover
+        # sheets, separators), skip Tesseract entirely
+        self._ocr_disk_dir = output_dir / ".ocr_cache"
+        self._ocr_salt = f"{ocr_backend}|oem1|psm6|eng".encode()
+
         # Initialize components
         self.classifier = classifier
-        self.organizer = DocumentOrganizer(output_dir, overwrite)
-    
-    def process_directory(self) -> None:
-        """Process all PDFs in the input directory."""
+        # Pre-create the category directories when the classifier exposes its
+        # taxonomy categories (LLMClassifier always does), so organizing skips
+        # the per-document mkdir
+        categories = getattr(classifier, "categories", None)
+        self.organizer = DocumentOrganizer(output_dir, overwrite,
+                                           taxonomy_categories=categories)
+
+        # Per-page OCR text for the PDF currently being processed. Sliding
+        # windows overlap, so without this each page would be OCR'd up to
+        # window_size times; with it, exactly once.
+        self._ocr_cache: dict[int, str] = {}
+        # Formatted "[PAGE n]\n{text}" strings per page; each page appears in
+        # up to window_size overlapping windows, so formatting once avoids
+        # re-allocating the marker-prefixed copy of the page text every time
+        self._formatted_cache: dict[int, str] = {}
+        # Joined window text keyed by (start_page, end_page); the adaptive
+        # loop can revisit a window after partial classifications, and the
+        # join over window_size page texts is not free on large windows
+        self._window_cache: dict[tuple[int, int], str] = {}
+
+    def _ocr_disk_get(self, key: str) -> str | None:
+        """Look up a page's OCR text in the on-disk cache.
+
+        Args:
+            key: Cache key from page_image_cache_key
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        try:
+            return (self._ocr_disk_dir / f"{key}.txt").read_text()
+        except OSError:
+            return None
+
+    def _ocr_disk_put(self, key: str, text: str) -> None:
+        """Store a page's OCR text in the on-disk cache, best-effort.
+
+        Args:
+            key: Cache key from page_image_cache_key
+            text: Extracted text to store
+        """
+        try:
+            self._ocr_disk_dir.mkdir(parents=True, exist_ok=True)
+            (self._ocr_disk_dir / f"{key}.txt").write_text(text)
+        except OSError:
+            pass  # Caching is an optimization; never fail the run over it
+
+    def _get_easyocr_reader(self):
+        """Get the EasyOCR reader, initializing its model at most once.
+
+        Downgrades to the Tesseract backend with a warning when easyocr isn't
+        installed or no CUDA device is available, so a GPU-less deploy still
+        works with the same configuration.
+
+        Returns:
+            easyocr.Reader instance, or None when unavailable
+        """
+        if self.ocr_backend != "easyocr":
+            return None
+        if self._easyocr_reader is None:
+            try:
+                import easyocr  # noqa: PLC0415 - optional dependency
+                import torch  # noqa: PLC0415 - pulled in by easyocr
+
+                if not torch.cuda.is_available():
+                    raise RuntimeError("no CUDA device available")
+                self._easyocr_reader = easyocr.Reader(['en'], gpu=True)
+            except (ImportError, RuntimeError) as err:
+                logger.warning(f"EasyOCR backend unavailable ({err}); using Tesseract")
+                self.ocr_backend = "tesseract"
+                return None
+        return self._easyocr_reader
+
+    def _easyocr_page_text(self, page_image) -> str:
+        """Extract a page's text with the GPU-backed EasyOCR reader.
+
+        Args:
+            page_image: PIL Image object of the page
+
+        Returns:
+            Extracted text for the page
+        """
+        import numpy  # noqa: PLC0415 - pulled in by easyocr
+
+        lines = self._easyocr_reader.readtext(
+            numpy.asarray(page_image), detail=0, batch_size=8
+        )
+        return "\n".join(lines)
+
+    def _populate_ocr_cache(self, images: list) -> None:
+        """OCR all pages up front, fanning the work out across a process pool.
+
+        OCR is embarrassingly parallel and CPU-bound, so this scales with
+        min(cores, pages) on scanned PDFs.
+
+        Args:
+            images: List of page images for the current PDF
+        """
+        needs_ocr = self._pages_needing_ocr(images)
+        if not needs_ocr:
+            return
+
+        if self._get_easyocr_reader() is not None:
+            # GPU inference batches internally; a process pool would only
+            # force one model load per worker
+            for page_num in needs_ocr:
+                self._ocr_cache[page_num] = self._easyocr_page_text(images[page_num - 1])
+            return
+
+        if self.ocr_workers == 1 or len(needs_ocr) <= 1:
+            return  # Pages will be OCR'd lazily on demand
+
+        # Strips of pages per Tesseract call amortize its startup cost; strips
+        # fan out across the pool. Submission is pipelined with a bounded
+        # in-flight window so page rendering (main thread) overlaps OCR
+        # (workers) instead of rasterizing every page before the first
+        # Tesseract call — and only a few strips of images are resident
+        strip_pages = [
+            needs_ocr[i:i + _OCR_STRIP_SIZE]
+            for i in range(0, len(needs_ocr), _OCR_STRIP_SIZE)
+        ]
+        max_in_flight = (self.ocr_workers or os.cpu_count() or 4) + 1
+        with ProcessPoolExecutor(max_workers=self.ocr_workers) as executor:
+            in_flight = deque()
+            for pages in strip_pages:
+                strip = []
+                strip_keys = []
+                strip_misses = []
+                for page_num in pages:
+                    image = images[page_num - 1]
+                    key = page_image_cache_key(image, self._ocr_salt)
+                    cached = self._ocr_disk_get(key)
+                    if cached is not None:
+                        self._ocr_cache[page_num] = cached
+                        continue
+                    # Binarize before the image crosses the process boundary:
+                    # a 1-bit page pickles ~24x smaller than RGB, so worker
+                    # hand-off stops dominating at high worker counts
+                    strip.append(binarize_for_ocr(image))
+                    strip_keys.append(key)
+                    strip_misses.append(page_num)
+                if not strip:
+                    continue
+                in_flight.append(
+                    (strip_misses, strip_keys,
+                     executor.submit(extract_text_from_page_strip, strip))
+                )
+                if len(in_flight) >= max_in_flight:
+                    self._store_strip_result(*in_flight.popleft())
+            while in_flight:
+                self._store_strip_result(*in_flight.popleft())
+
+    def _pages_needing_ocr(self, images: list) -> list[int]:
+        """Find pages whose text can't come from an embedded text layer.
+
+        Usable layers are stored in the OCR cache as a side effect, so mixed
+        scanned+digital PDFs commonly skip rendering and OCR for most pages.
+
+        Args:
+            images: Page images for the current PDF
+
+        Returns:
+            One-indexed page numbers that still need OCR
+        """
+        if not isinstance(images, LazyPageImages):
+            return list(range(1, len(images) + 1))
+
+        needs_ocr = []
+        for page_num in range(1, len(images) + 1):
+            embedded = images.embedded_text(page_num - 1)
+            if text_layer_usable(embedded):
+                self._ocr_cache[page_num] = embedded
+            else:
+                needs_ocr.append(page_num)
+        return needs_ocr
+
+    def _store_strip_result(self, pages: list, keys: list, future) -> None:
+        """Record one OCR strip's results in the per-page and disk caches.
+
+        Args:
+            pages: One-indexed page numbers the strip covers, in order
+            keys: Disk-cache keys for those pages, in the same order
+            future: Future resolving to the strip's extracted texts
+        """
+        for page_num, key, text in zip(pages, keys, future.result(), strict=True):
+            self._ocr_cache[page_num] = text or ""
+            self._ocr_disk_put(key, text or "")
+
+    def _page_text(self, images: list, page_num: int) -> str:
+        """OCR a page of the current PDF at most once.
+
+        Args:
+            images: List of page images for the current PDF
+            page_num: One-indexed page number
+
+        Returns:
+            Extracted text for the page
+        """
+        if page_num not in self._ocr_cache:
+            # Prefer the embedded text layer when the page has one; OCR only
+            # scan-only pages
+            text = None
+            if isinstance(images, LazyPageImages):
+                text = images.embedded_text(page_num - 1)
+            if not text_layer_usable(text):
+                image = images[page_num - 1]
+                text = None
+                # Only PIL images have stable bytes to key the disk cache on
+                key = None
+                if hasattr(image, "tobytes"):
+                    key = page_image_cache_key(image, self._ocr_salt)
+                    text = self._ocr_disk_get(key)
+                if text is None:
+                    if self._get_easyocr_reader() is not None:
+                        text = self._easyocr_page_text(image)
+                    else:
+                        text = extract_text_from_page(image)
+                    if key is not None:
+                        self._ocr_disk_put(key, text or "")
+            self._ocr_cache[page_num] = text or ""
+        return self._ocr_cache[page_num]
+
+    def _window_text(self, images: list, start_page: int, end_page: int) -> str:
+        """Build window text from cached per-page OCR results.
+
+        Args:
+            images: List of page images for the current PDF
+            start_page: One-indexed start page
+            end_page: One-indexed end page (inclusive)
+
+        Returns:
+            Combined text for the window, with page markers
+
+        Raises:
+            ValueError: If page range is invalid
+        """
+        if start_page < 1 or end_page > len(images):
+            raise ValueError(f"Invalid page range: {start_page}-{end_page}")
+
+        key = (start_page, end_page)
+        if key not in self._window_cache:
+            self._window_cache[key] = "\n\n".join(
+                self._formatted_page(images, page_num)
+                for page_num in range(start_page, end_page + 1)
+            )
+        return self._window_cache[key]
+
+    def _formatted_page(self, images: list, page_num: int) -> str:
+        """Get a page's marker-prefixed text, formatted at most once.
+
+        Args:
+            images: List of page images for the current PDF
+            page_num: One-indexed page number
+
+        Returns:
+            The page text prefixed with its "[PAGE n]" marker
+        """
+        if page_num not in self._formatted_cache:
+            self._formatted_cache[page_num] = (
+                f"[PAGE {page_num}]\n{self._page_text(images, page_num)}"
+            )
+        return self._formatted_cache[page_num]
+
+    def _spawn_worker(self) -> "EstatePDFProcessor":
+        """Create a processor sharing this one's classifier and organizer.
+
+        The per-PDF caches (_ocr_cache, _window_cache) live on the instance,
+        so concurrent PDFs each get their own clone instead of racing on one.
+
+        Returns:
+            Processor instance safe to run one PDF on its own thread
+        """
+        worker = EstatePDFProcessor(
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            classifier=self.classifier,
+            overwrite=self.overwrite,
+            dry_run=self.dry_run,
+            window_size=self.window_size,
+            use_batch_api=self.use_batch_api,
+            remove_blank_pages=self.remove_blank_pages,
+            ocr_workers=self.ocr_workers,
+            ocr_backend=self.ocr_backend,
+            dpi=self.dpi,
+            grayscale=self.grayscale,
+        )
+        worker.organizer = self.organizer
+        return worker
+
+    def process_directory(self) -> list[DocumentMetadata]:
+        """Process all PDFs in the input directory.
+
+        With pdf_workers > 1, independent PDFs run concurrently on threads:
+        each thread's OCR still fans out to its own process pool and its LLM
+        calls are network-bound, so neither holds the GIL for long. Classifier
+        and organizer are shared; metadata is saved once at the end.
+
+        Returns:
+            Metadata for every document extracted (or planned, in dry runs)
+        """
         # Get all PDF files in input directory
         pdf_files = list(self.input_dir.glob("*.pdf"))
-        
-        for pdf_path in pdf_files:
-            logger.info(f"Processing {pdf_path.name}...")
-            self.process_pdf(pdf_path)
-            
+        metadata_start = len(self.organizer.metadata)
+
+        if self.pdf_workers > 1 and len(pdf_files) > 1:
+            def run_one(path: Path) -> None:
+                logger.info(f"Processing {path.name}...")
+                self._spawn_worker().process_pdf(path)
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.pdf_workers, len(pdf_files))
+            ) as executor:
+                for future in [executor.submit(run_one, path) for path in pdf_files]:
+                    future.result()
+            pdf_path = pdf_files[-1]
+        else:
+            for pdf_path in pdf_files:
+                logger.info(f"Processing {pdf_path.name}...")
+                self.process_pdf(pdf_path)
+
         # Save all metadata
         if not self.dry_run:
             metadata_path = self.output_dir / f"{pdf_path.stem}_metadata.yaml"
             self.organizer.save_metadata(metadata_path)
-    
-    def process_pdf(self, pdf_path: Path) -> None:
+
+        return self.organizer.metadata[metadata_start:]
+
+    def process_pdf(self, pdf_path: Path) -> list[DocumentMetadata]:
         """Process a single PDF file.
-        
+
         Args:
             pdf_path: Path to the PDF file to process
+
+        Returns:
+            Metadata for every document extracted (or planned, in dry runs)
         """
+        metadata_start = len(self.organizer.metadata)
         # Read PDF and convert to images
-        reader, total_pages, images = read_pdf(pdf_path)
-        
-        # Process the PDF in windows to find document boundaries
-        current_page = 1
+        reader, total_pages, images = read_pdf(pdf_path, dpi=self.dpi,
+                                               grayscale=self.grayscale)
+
+        self._ocr_cache = {}  # OCR results are per-PDF
+        self._formatted_cache = {}
+        self._window_cache = {}
+        try:
+            self._process_pdf_inner(reader, pdf_path, images, total_pages)
+        finally:
+            # Free the per-PDF text caches promptly rather than holding a
+            # document's worth of OCR output until the next file resets them
+            self._ocr_cache = {}
+            self._formatted_cache = {}
+            self._window_cache = {}
+
+        return self.organizer.metadata[metadata_start:]
+
+    def _process_pdf_inner(
+        self,
+        reader: PdfReader,
+        pdf_path: Path,
+        images: list,
+        total_pages: int,
+    ) -> None:
+        """Run the classification, blank-removal, and leftover-page passes.
+
+        Args:
+            reader: Already opened PDF reader
+            pdf_path: Path to the PDF file being processed
+            images: Page images for OCR
+            total_pages: Total number of pages in the PDF
+        """
+        self._populate_ocr_cache(images)
         processed_pages = set()  # Track which pages have been processed
-        
-        while current_page <= total_pages:
-            # Calculate window end page
-            window_end = min(current_page + self.window_size - 1, total_pages)
-            
-            # Extract text for the current window
-            window_text = extract_text_from_pages(images, current_page, window_end)
-            
-            # Classify the window to find document boundaries and types
-            classifications = self.classifier.classify(window_text)
-            
-            if not classifications:
-                # No documents found in this window, move to next window
-                current_page = current_page + 1
+
+        if self.use_batch_api:
+            self._process_pdf_batch(reader, pdf_path, images, total_pages, processed_pages)
+        else:
+            self._process_pdf_windowed(reader, pdf_path, images, total_pages, processed_pages)
+
+        # Drop blank pages so they don't end up in Unorganized documents
+        blank_pages = set()
+        if self.remove_blank_pages:
+            blank_pages = self._find_blank_pages(images, total_pages, processed_pages)
+            if blank_pages:
+                logger.info(f"Removing {len(blank_pages)} blank pages from {pdf_path.name}: {sorted(blank_pages)}")  # noqa: E501
+
+        # Handle any unprocessed pages: one ordered pass emits both the flat
+        # list and the consecutive groups, with no set difference or sort
+        unprocessed_pages = []
+        groups = []
+        for page in range(1, total_pages + 1):
+            if page in processed_pages or page in blank_pages:
                 continue
-            
-            # Sort classifications by start page to process them in order
-            classifications.sort(key=lambda x: x.page_start)
-            
-            # Process each classification
-            for c in classifications:
-                # Skip if we've already processed any pages in this range
-                if any(page in processed_pages for page in range(c.page_start, c.page_end + 1)):
-                    logger.warning(f"Skipping overlapping document: {c.document_type} (pages {c.page_start}-{c.page_end})")  # noqa: E501
-                    continue
-                
-                # Organize the document
-                self.organizer.organize_document(
-                    pdf_reader=reader,
-                    source_pdf_path=str(pdf_path),
-                    start_page=c.page_start,
-                    end_page=c.page_end,
-                    document_type=c.document_type,
-                    dry_run=self.dry_run,
-                    suggested_filename=c.suggested_filename
-                )
-                
-                # Mark pages as processed
-                processed_pages.update(range(c.page_start, c.page_end + 1))
-                
-                msg = f"Found {c.document_type}"
-                msg += f" (pages {c.page_start}-{c.page_end})"
-                if c.suggested_filename:
-                    msg += f" -> {c.suggested_filename}"
-                logger.info(msg)
-            
-            # Move to the next unprocessed page
-            current_page = max(processed_pages) + 1 if processed_pages else window_end + 1
-        
-        # Handle any unprocessed pages
-        all_pages = set(range(1, total_pages + 1))
-        unprocessed_pages = sorted(all_pages - processed_pages)
+            if unprocessed_pages and page == unprocessed_pages[-1] + 1:
+                groups[-1].append(page)
+            else:
+                groups.append([page])
+            unprocessed_pages.append(page)
+
         if unprocessed_pages:
             logger.warning(f"Found {len(unprocessed_pages)} unprocessed pages in {pdf_path.name}: {unprocessed_pages}")  # noqa: E501
             self.organizer.add_unprocessed_pages(str(pdf_path), unprocessed_pages)
-            
-            # Group consecutive unprocessed pages
-            groups = []
-            current_group = [unprocessed_pages[0]]
-            for page in unprocessed_pages[1:]:
-                if page == current_group[-1] + 1:
-                    current_group.append(page)
-                else:
-                    groups.append(current_group)
-                    current_group = [page]
-            groups.append(current_group)
-            
+
             # Create unorganized documents for each group
             for group in groups:
                 self.organizer.organize_document(
@@ -212,5 +863,192 @@ class EstatePDFProcessor:
                     end_page=group[-1],
                     document_type="Unorganized",
                     dry_run=self.dry_run,
-                    suggested_filename=f"unorganized_pages_{group[0]}-{group[-1]}.pdf"
+                    suggested_filename=f"unorganized_pages_{group[0]}-{group[-1]}.pdf",
+                    total_pages=total_pages
                 )
+
+    def _find_blank_pages(self, images: list, total_pages: int, processed_pages: set) -> set:
+        """Find blank pages among those not covered by any classification.
+
+        A cheap pixel-statistics check runs first: uniformly blank pages are
+        marked and clearly inked pages kept, both without OCR. Only ambiguous
+        pages fall through to the text check, which reuses OCR results cached
+        by the classification pass.
+
+        Args:
+            images: Page images for the current PDF
+            total_pages: Total number of pages in the PDF
+            processed_pages: Pages already organized into documents
+
+        Returns:
+            Set of 1-based page numbers judged blank
+        """
+        blank_pages = set()
+        for page_num in range(1, total_pages + 1):
+            if page_num in processed_pages:
+                continue
+            if page_num not in self._ocr_cache:
+                std = page_pixel_stddev(images[page_num - 1])
+                if std < _BLANK_STD_LOW:
+                    blank_pages.add(page_num)
+                    continue
+                if std > _BLANK_STD_HIGH:
+                    continue
+            if is_blank_page(self._page_text(images, page_num)):
+                blank_pages.add(page_num)
+        return blank_pages
+
+    def _process_pdf_windowed(
+        self,
+        reader: PdfReader,
+        pdf_path: Path,
+        images: list,
+        total_pages: int,
+        processed_pages: set,
+    ) -> None:
+        """Process a PDF with the adaptive sliding-window strategy.
+
+        Args:
+            reader: Already opened PDF reader
+            pdf_path: Path to the PDF file being processed
+            images: Page images for OCR
+            total_pages: Total number of pages in the PDF
+            processed_pages: Set updated in place with pages that were organized
+        """
+        current_page = 1
+        max_processed = 0  # Highest organized page, tracked incrementally
+        while current_page <= total_pages:
+            # Calculate window end page
+            window_end = min(current_page + self.window_size - 1, total_pages)
+
+            # Extract text for the current window
+            window_text = self._window_text(images, current_page, window_end)
+
+            # Classify the window to find document boundaries and types
+            classifications = self.classifier.classify(window_text)
+
+            if not classifications:
+                # No documents found in this window, move to next window
+                current_page = current_page + 1
+                continue
+
+            organized_max = self._organize_classifications(
+                classifications, reader, pdf_path, processed_pages, total_pages
+            )
+            max_processed = max(max_processed, organized_max)
+
+            # Move to the next unprocessed page; the tracked max avoids an
+            # O(n) scan of processed_pages every window
+            current_page = max_processed + 1 if max_processed else window_end + 1
+            self._evict_window_state(current_page)
+
+    def _evict_window_state(self, current_page: int) -> None:
+        """Drop derived window text for pages the sliding window has passed.
+
+        The formatted-page and joined-window caches duplicate page text up to
+        window_size times; once the loop moves past a page those copies can't
+        be requested again, so evicting them keeps derived-text memory at
+        O(window) instead of O(pages x window). The raw OCR cache is kept for
+        the blank-page pass.
+
+        Args:
+            current_page: First page the sliding window can still visit
+        """
+        for page_num in [p for p in self._formatted_cache if p < current_page]:
+            del self._formatted_cache[page_num]
+        for key in [k for k in self._window_cache if k[1] < current_page]:
+            del self._window_cache[key]
+
+    def _process_pdf_batch(
+        self,
+        reader: PdfReader,
+        pdf_path: Path,
+        images: list,
+        total_pages: int,
+        processed_pages: set,
+    ) -> None:
+        """Process a PDF by batch-classifying fixed non-overlapping windows.
+
+        Args:
+            reader: Already opened PDF reader
+            pdf_path: Path to the PDF file being processed
+            images: Page images for OCR
+            total_pages: Total number of pages in the PDF
+            processed_pages: Set updated in place with pages that were organized
+        """
+        window_texts = []
+        for window_start in range(1, total_pages + 1, self.window_size):
+            window_end = min(window_start + self.window_size - 1, total_pages)
+            window_texts.append(self._window_text(images, window_start, window_end))
+
+        # Prefer the half-price asynchronous Batch API; classifiers without
+        # it still get one batched round of requests instead of a network
+        # round-trip per window
+        if hasattr(self.classifier, "classify_with_batch_api"):
+            window_results = self.classifier.classify_with_batch_api(window_texts)
+        else:
+            window_results = self.classifier.classify_batch(window_texts)
+
+        classifications = [c for results in window_results for c in results]
+        self._organize_classifications(
+            classifications, reader, pdf_path, processed_pages, total_pages
+        )
+
+    def _organize_classifications(
+        self,
+        classifications: list,
+        reader: PdfReader,
+        pdf_path: Path,
+        processed_pages: set,
+        total_pages: int | None = None,
+    ) -> int:
+        """Organize classified documents, skipping any that overlap processed pages.
+
+        Args:
+            classifications: ClassificationResult objects to organize
+            reader: Already opened PDF reader
+            pdf_path: Path to the PDF file being processed
+            processed_pages: Set updated in place with pages that were organized
+            total_pages: Known page count, forwarded so range validation
+                doesn't re-walk the reader's page tree
+
+        Returns:
+            Highest page number organized by this call, or 0 if none were
+        """
+        # Process classifications in start-page order. The classifier is
+        # prompted to emit ascending results, so a linear sortedness check
+        # usually replaces the sort
+        if any(a.page_start > b.page_start for a, b in pairwise(classifications)):
+            classifications.sort(key=lambda x: x.page_start)
+
+        max_organized = 0
+        for c in classifications:
+            # Skip if we've already processed any pages in this range
+            if any(page in processed_pages for page in range(c.page_start, c.page_end + 1)):
+                logger.warning(f"Skipping overlapping document: {c.document_type} (pages {c.page_start}-{c.page_end})")  # noqa: E501
+                continue
+
+            # Organize the document
+            self.organizer.organize_document(
+                pdf_reader=reader,
+                source_pdf_path=str(pdf_path),
+                start_page=c.page_start,
+                end_page=c.page_end,
+                document_type=c.document_type,
+                dry_run=self.dry_run,
+                suggested_filename=c.suggested_filename,
+                total_pages=total_pages
+            )
+
+            # Mark pages as processed
+            processed_pages.update(range(c.page_start, c.page_end + 1))
+            max_organized = max(max_organized, c.page_end)
+
+            msg = f"Found {c.document_type}"
+            msg += f" (pages {c.page_start}-{c.page_end})"
+            if c.suggested_filename:
+                msg += f" -> {c.suggested_filename}"
+            logger.info(msg)
+
+        return max_organized
+
@@ -0,0 +1,370 @@
+"""Tests for the document classifier module."""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available; fall back to the pure-Python dumper
+    from yaml import SafeDumper
+
+from estate_pdf_organizer.classifier import (
+    LLMCache,
+    LLMClassifier,
+    MemoryBackend,
+    _load_taxonomy,
+)
+
+
+class FakeResponse:
+    """Fake LLM response with a content attribute."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+class FakeLLM:
+    """Fake LLM that returns a canned response and counts invocations."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.model_name = "fake-model"
+        self.temperature = 0
+        self.invocations = 0
+
+    def invoke(self, messages):
+        self.invocations += 1
+        return FakeResponse(self.content)
+
+    def batch(self, prompts):
+        self.invocations += 1
+        return [FakeResponse(self.content) for _ in prompts]
+
+    async def ainvoke(self, messages):
+        self.invocations += 1
+        return FakeResponse(self.content)
+
+class FakeBatchClient:
+    """Fake OpenAI client covering the Batch API surface the classifier uses."""
+
+    def __init__(self, contents: list[str]):
+        """Initialize the fake client.
+
+        Args:
+            contents: One response content string per submitted window
+        """
+        self.uploaded_lines = None
+        output = "\n".join(json.dumps({
+            "custom_id": f"window_{i}",
+            "response": {"body": {"choices": [{"message": {"content": content}}]}},
+        }) for i, content in enumerate(contents))
+        self.files = SimpleNamespace(
+            create=self._create_file,
+            content=lambda file_id: SimpleNamespace(text=output),
+        )
+        self.batches = SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="batch-1"),
+            retrieve=lambda batch_id: SimpleNamespace(
+                status="completed", output_file_id="out-1"
+            ),
+        )
+
+    def _create_file(self, file, purpose):
+        name, data = file
+        self.uploaded_lines = [json.loads(line) for line in data.decode().splitlines()]
+        return SimpleNamespace(id="file-1")
+
+def create_test_taxonomy(taxonomy_path: Path) -> None:
+    """Create a test taxonomy file.
+
+    Args:
+        taxonomy_path: Path to create taxonomy file at
+    """
+    taxonomy = {
+        "categories": [
+            "Will",
+            "Trust",
+            "Other"
+        ]
+    }
+
+    with open(taxonomy_path, 'w') as f:
+        yaml.dump(taxonomy, f, Dumper=SafeDumper)
+
+def create_classifier(taxonomy_dir: str, **kwargs) -> LLMClassifier:
+    """Create an LLMClassifier with a test taxonomy.
+
+    The taxonomy pickle cache is pointed inside taxonomy_dir so test runs
+    never write into the user's real ~/.cache directory.
+
+    Args:
+        taxonomy_dir: Directory to create the taxonomy file in
+
+    Returns:
+        LLMClassifier instance
+    """
+    taxonomy_path = Path(taxonomy_dir) / "taxonomy.yaml"
+    create_test_taxonomy(taxonomy_path)
+    kwargs.setdefault("taxonomy_cache_dir", Path(taxonomy_dir) / ".taxonomy_cache")
+    return LLMClassifier(taxonomy_path, api_key="test-key", **kwargs)
+
+def test_load_taxonomy_pickle_cache(tmp_path):
+    """Test that the taxonomy cache is written and invalidated by mtime."""
+    taxonomy_dir = tmp_path / "taxonomy"
+    cache_dir = tmp_path / "cache"
+    for d in (taxonomy_dir, cache_dir):
+        d.mkdir()
+    taxonomy_path = Path(taxonomy_dir) / "taxonomy.yaml"
+    create_test_taxonomy(taxonomy_path)
+
+    first = _load_taxonomy(taxonomy_path, cache_dir=Path(cache_dir))
+    assert len(list(Path(cache_dir).glob("*.pkl"))) == 1
+
+    # Second load comes from the pickle cache
+    second = _load_taxonomy(taxonomy_path, cache_dir=Path(cache_dir))
+    assert second == first
+
+    # Touching the file invalidates the cache key
+    stat = taxonomy_path.stat()
+    os.utime(taxonomy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    _load_taxonomy(taxonomy_path, cache_dir=Path(cache_dir))
+    assert len(list(Path(cache_dir).glob("*.pkl"))) == 2
+
+def test_memory_backend_lru_eviction():
+    """Test that MemoryBackend evicts least-recently-used entries."""
+    backend = MemoryBackend(max_size=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+
+    # Touch "a" so "b" becomes least-recently-used
+    assert backend.get("a") == "1"
+    backend.set("c", "3")
+
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+def test_memory_backend_ttl_expiry():
+    """Test that MemoryBackend expires entries after the TTL."""
+    backend = MemoryBackend(ttl=0)
+    backend.set("a", "1")
+
+    assert backend.get("a") is None
+
+def test_llm_cache_exact_hit():
+    """Test exact-match caching keyed on the full request."""
+    cache = LLMCache()
+    key = LLMCache.key_for(
+        model="fake-model",
+        messages=[{"role": "user", "content": "hello"}],
+        temperature=0
+    )
+
+    assert cache.get(key) is None
+    cache.set(key, "response")
+    assert cache.get(key) == "response"
+
+def test_classify_uses_cache(tmp_path):
+    """Test that repeated classifications skip the LLM call."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps([{
+        "document_type": "Will",
+        "confidence": 0.95,
+        "page_start": 1,
+        "page_end": 2,
+        "suggested_filename": "will.pdf"
+    }]))
+
+    first = classifier.classify("[PAGE 1]\nLast will and testament")
+    second = classifier.classify("[PAGE 1]\nLast will and testament")
+
+    assert classifier.llm.invocations == 1
+    assert first[0].document_type == "Will"
+    assert second[0].document_type == "Will"
+    assert second[0].page_start == 1
+    assert second[0].page_end == 2
+
+def test_fast_patterns_skip_llm(tmp_path):
+    """Test that unambiguous headers are classified without an LLM call."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(
+        taxonomy_dir,
+        fast_patterns={"Will": [r"LAST WILL AND TESTAMENT"]}
+    )
+    classifier.llm = FakeLLM("[]")
+
+    results = classifier.classify("[PAGE 3]\nLast Will and Testament of Jane Doe\n\n[PAGE 4]\nmore text")  # noqa: E501
+
+    assert classifier.llm.invocations == 0
+    assert len(results) == 1
+    assert results[0].document_type == "Will"
+    assert results[0].confidence == 0.99
+    assert results[0].page_start == 3
+    assert results[0].page_end == 4
+
+def test_fast_patterns_unknown_category(tmp_path):
+    """Test that pattern categories must exist in the taxonomy."""
+    taxonomy_dir = tmp_path
+    try:
+        create_classifier(taxonomy_dir, fast_patterns={"Bogus": [r"x"]})
+        assert False, "Expected ValueError for unknown pattern category"
+    except ValueError:
+        pass
+
+def test_classify_parses_structured_output(tmp_path):
+    """Test parsing a structured-output response wrapped in a documents object."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps({"documents": [{
+        "document_type": "Trust",
+        "confidence": 0.9,
+        "page_start": 2,
+        "page_end": 4,
+        "suggested_filename": None
+    }]}))
+
+    results = classifier.classify("page text")
+
+    assert len(results) == 1
+    assert results[0].document_type == "Trust"
+    assert results[0].suggested_filename is None
+
+def test_truncate_short_text_unchanged(tmp_path):
+    """Test that text within the token budget is passed through untouched."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir, max_input_tokens=100)
+
+    assert classifier._truncate("short window text") == "short window text"
+
+def test_truncate_long_text_keeps_head_and_tail(tmp_path):
+    """Test that over-budget text is truncated keeping head and tail."""
+
+    class FakeEncoder:
+        """Character-level stand-in for the tiktoken encoder."""
+
+        def encode(self, text):
+            return list(text)
+
+        def decode(self, tokens):
+            return "".join(tokens)
+
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir, max_input_tokens=10)
+    classifier._enc = FakeEncoder()
+
+    truncated = classifier._truncate("HEADxxxxxxxxxxxxxxxxTAIL")
+
+    assert truncated.startswith("HEADx")
+    assert truncated.endswith("xTAIL")
+    assert "...[truncated]..." in truncated
+
+def test_classify_parses_compact_fields(tmp_path):
+    """Test parsing the compact schema with an integer category index."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps({"documents": [
+        {"t": 0, "c": 0.85, "s": 1, "e": 3, "f": "will_2020-01-01.pdf"}
+    ]}))
+
+    results = classifier.classify("page text")
+
+    assert len(results) == 1
+    assert results[0].document_type == "Will"
+    assert results[0].confidence == 0.85
+    assert results[0].page_start == 1
+    assert results[0].page_end == 3
+    assert results[0].suggested_filename == "will_2020-01-01.pdf"
+
+def test_classify_rejects_bad_category_index(tmp_path):
+    """Test that an out-of-range category index is rejected."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps({"documents": [
+        {"t": 99, "c": 0.85, "s": 1, "e": 3, "f": None}
+    ]}))
+
+    try:
+        classifier.classify("page text")
+        assert False, "Expected ValueError for bad category index"
+    except ValueError:
+        pass
+
+def test_classify_batch_small_batch(tmp_path):
+    """Test that small batches go through a single batch call."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps([{
+        "document_type": "Trust",
+        "confidence": 0.9,
+        "page_start": 1,
+        "page_end": 1
+    }]))
+
+    results = classifier.classify_batch(["page one", "page two", "page three"])
+
+    assert classifier.llm.invocations == 1
+    assert len(results) == 3
+    assert all(r[0].document_type == "Trust" for r in results)
+
+def test_classify_batch_concurrent(tmp_path):
+    """Test that large batches fan out concurrently."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps([{
+        "document_type": "Will",
+        "confidence": 0.9,
+        "page_start": 1,
+        "page_end": 1
+    }]))
+
+    texts = [f"page {i}" for i in range(8)]
+    results = classifier.classify_batch(texts, concurrency_threshold=5)
+
+    assert classifier.llm.invocations == 8
+    assert len(results) == 8
+
+def test_classify_batch_uses_cache(tmp_path):
+    """Test that classify_batch reuses cached classify results."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier.llm = FakeLLM(json.dumps([{
+        "document_type": "Will",
+        "confidence": 0.9,
+        "page_start": 1,
+        "page_end": 1
+    }]))
+
+    classifier.classify("page one")
+    results = classifier.classify_batch(["page one", "page two"])
+
+    # "page one" was served from the cache; only "page two" hit the LLM
+    assert classifier.llm.invocations == 2
+    assert len(results) == 2
+
+def test_classify_with_batch_api(tmp_path):
+    """Test the Batch API round trip and its request bodies."""
+    taxonomy_dir = tmp_path
+    classifier = create_classifier(taxonomy_dir)
+    classifier._client = FakeBatchClient([
+        json.dumps({"documents": [{"t": 0, "c": 0.9, "s": 1, "e": 2, "f": None}]}),
+        json.dumps({"documents": [{"t": 1, "c": 0.8, "s": 3, "e": 4, "f": None}]}),
+    ])
+
+    results = classifier.classify_with_batch_api(["window one", "window two"])
+
+    assert len(results) == 2
+    assert results[0][0].document_type == "Will"
+    assert results[0][0].page_end == 2
+    assert results[1][0].document_type == "Trust"
+
+    # Each request body asks for schema-enforced JSON like the sync path does
+    assert len(classifier._client.uploaded_lines) == 2
+    for line in classifier._client.uploaded_lines:
+        body = line["body"]
+        assert body["temperature"] == 0
+        assert body["response_format"]["type"] == "json_schema"
+        assert "schema" in body["response_format"]["json_schema"]
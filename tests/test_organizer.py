@@ -1,14 +1,39 @@
 """Tests for the document organizer module."""
 
-import tempfile
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
+import orjson
+
 import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available; fall back to the pure-Python loader
+    from yaml import SafeLoader
+
+import pymupdf
 from pypdf import PdfReader, PdfWriter
 
 from estate_pdf_organizer.organizer import DocumentMetadata, DocumentOrganizer
 
 
+@lru_cache(maxsize=4)
+def _blank_pdf_bytes(num_pages: int) -> bytes:
+    """Serialize a blank letter-size PDF once per page count.
+
+    The output is deterministic, so every test that needs an n-page blank
+    fixture writes the same cached bytes instead of rebuilding the writer.
+    """
+    writer = PdfWriter()
+    for _ in range(num_pages):
+        writer.add_blank_page(width=612, height=792)
+    buf = BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
 def test_document_metadata():
     """Test DocumentMetadata dataclass."""
     metadata = DocumentMetadata(
@@ -28,293 +53,469 @@ def test_document_metadata():
     assert metadata.confidence == 0.95
     assert metadata.output_path is None
 
-def test_document_organizer_initialization():
+def test_document_metadata_uses_slots():
+    """Test that DocumentMetadata stays slotted (no per-instance __dict__)."""
+    metadata = DocumentMetadata(
+        source_pdf="test.pdf",
+        start_page=1,
+        end_page=3,
+        document_type="Important Documents",
+        filename="will.pdf",
+        confidence=0.95
+    )
+
+    assert not hasattr(metadata, "__dict__")
+    try:
+        metadata.unexpected_field = "value"
+        raise AssertionError("Expected AttributeError for unknown attribute")
+    except AttributeError:
+        pass
+
+def test_document_organizer_initialization(tmp_path):
     """Test initializing the document organizer."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        organizer = DocumentOrganizer(Path(temp_dir))
-        assert organizer.output_dir == Path(temp_dir)
-        assert not organizer.overwrite
-        assert len(organizer.metadata) == 0
+    temp_dir = tmp_path
+    organizer = DocumentOrganizer(Path(temp_dir))
+    assert organizer.output_dir == Path(temp_dir)
+    assert not organizer.overwrite
+    assert len(organizer.metadata) == 0
         
-        # Verify output directory was created
-        assert Path(temp_dir).exists()
-        assert (Path(temp_dir) / "Unorganized").exists()
+    # Verify output directory was created
+    assert Path(temp_dir).exists()
+    assert (Path(temp_dir) / "Unorganized").exists()
 
-def test_add_document():
+def test_add_document(tmp_path):
     """Test adding documents to the organizer."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        organizer = DocumentOrganizer(Path(temp_dir))
-        metadata = DocumentMetadata(
-            source_pdf="test.pdf",
-            start_page=1,
-            end_page=3,
-            document_type="Important Documents",
-            filename="will.pdf",
-            confidence=0.95
-        )
+    temp_dir = tmp_path
+    organizer = DocumentOrganizer(Path(temp_dir))
+    metadata = DocumentMetadata(
+        source_pdf="test.pdf",
+        start_page=1,
+        end_page=3,
+        document_type="Important Documents",
+        filename="will.pdf",
+        confidence=0.95
+    )
         
-        organizer.add_document(metadata)
-        assert len(organizer.metadata) == 1
-        assert organizer.metadata[0] == metadata
+    organizer.add_document(metadata)
+    assert len(organizer.metadata) == 1
+    assert organizer.metadata[0] == metadata
 
-def test_organize_document_dry_run():
+def test_organize_document_dry_run(tmp_path):
     """Test document organization in dry-run mode."""
-    with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
-        # Create a simple PDF file with 3 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        writer = PdfWriter()
-        for i in range(3):
-            writer.add_blank_page(width=612, height=792)  # Standard letter size
-        with open(pdf_path, 'wb') as f:
-            writer.write(f)
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
         
-        # Open the PDF for reading
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PdfReader(f)
+    # Open the PDF for reading
+    with open(pdf_path, 'rb') as f:
+        pdf_reader = PdfReader(f)
             
-            organizer = DocumentOrganizer(Path(output_dir))
-            document_type = "Important Documents"
+        organizer = DocumentOrganizer(Path(output_dir))
+        document_type = "Important Documents"
             
-            result = organizer.organize_document(
-                pdf_reader=pdf_reader,
-                source_pdf_path=str(pdf_path),
-                start_page=1,
-                end_page=3,
-                document_type=document_type,
-                dry_run=True
-            )
+        result = organizer.organize_document(
+            pdf_reader=pdf_reader,
+            source_pdf_path=str(pdf_path),
+            start_page=1,
+            end_page=3,
+            document_type=document_type,
+            dry_run=True
+        )
             
-            # Verify metadata was created but no PDF files were written
-            assert result.source_pdf == str(pdf_path)
-            assert result.start_page == 1
-            assert result.end_page == 3
-            assert result.document_type == document_type
-            assert not any(Path(output_dir).glob("**/*.pdf"))
-
-def test_organize_document_with_real_pdf():
+        # Verify metadata was created but no PDF files were written
+        assert result.source_pdf == str(pdf_path)
+        assert result.start_page == 1
+        assert result.end_page == 3
+        assert result.document_type == document_type
+        # The would-be output path is recorded but nothing was written
+        assert not Path(result.output_path).exists()
+
+def test_organize_document_with_real_pdf(tmp_path):
     """Test organizing a document with a real PDF file."""
-    with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
-        # Create a simple PDF file with 3 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        writer = PdfWriter()
-        for i in range(3):
-            writer.add_blank_page(width=612, height=792)  # Standard letter size
-        with open(pdf_path, 'wb') as f:
-            writer.write(f)
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
         
-        # Open the PDF for reading
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PdfReader(f)
-            
-            organizer = DocumentOrganizer(Path(output_dir))
-            document_type = "Important Documents"
-            
-            result = organizer.organize_document(
-                pdf_reader=pdf_reader,
-                source_pdf_path=str(pdf_path),
-                start_page=1,
-                end_page=3,
-                document_type=document_type
-            )
-            
-            # Verify metadata was created
-            assert result.source_pdf == str(pdf_path)
-            assert result.start_page == 1
-            assert result.end_page == 3
-            assert result.document_type == document_type
+    # Open the PDF for reading
+    with open(pdf_path, 'rb') as f:
+        pdf_reader = PdfReader(f)
             
-            # Verify PDF file was created
-            output_path = Path(result.output_path)
-            assert output_path.exists()
+        organizer = DocumentOrganizer(Path(output_dir))
+        document_type = "Important Documents"
             
-            # Verify PDF content
-            with open(output_path, 'rb') as f:
-                output_reader = PdfReader(f)
-                assert len(output_reader.pages) == 3
-
-def test_save_metadata():
-    """Test saving metadata to YAML file."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        organizer = DocumentOrganizer(Path(temp_dir))
-        metadata = DocumentMetadata(
-            source_pdf="test.pdf",
+        result = organizer.organize_document(
+            pdf_reader=pdf_reader,
+            source_pdf_path=str(pdf_path),
             start_page=1,
             end_page=3,
-            document_type="Important Documents",
-            filename="will.pdf",
-            confidence=0.95,
-            output_path="output/Important Documents/will.pdf"
+            document_type=document_type
         )
+            
+        # Verify metadata was created
+        assert result.source_pdf == str(pdf_path)
+        assert result.start_page == 1
+        assert result.end_page == 3
+        assert result.document_type == document_type
+            
+        # Verify PDF file was created
+        output_path = Path(result.output_path)
+        assert output_path.exists()
+            
+        # Verify PDF content; page_count reads the /Count entry without
+        # realizing the whole page tree the way len(reader.pages) does
+        with pymupdf.open(str(output_path)) as doc:
+            assert doc.page_count == 3
+
+def test_organize_document_without_reader(tmp_path):
+    """Test organizing a document from a path, reusing a cached reader."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
+
+    organizer = DocumentOrganizer(Path(output_dir))
+
+    # Two documents from the same source should parse the PDF only once
+    organizer.organize_document(
+        source_pdf_path=str(pdf_path),
+        start_page=1,
+        end_page=1,
+        document_type="Important Documents"
+    )
+    organizer.organize_document(
+        source_pdf_path=str(pdf_path),
+        start_page=2,
+        end_page=3,
+        document_type="Important Documents"
+    )
+
+    assert len(organizer._reader_cache) == 1
+    assert len(list(Path(output_dir).glob("**/*.pdf"))) == 2
+
+    organizer.close()
+    assert len(organizer._reader_cache) == 0
+
+def test_organize_document_extracts_correct_range(tmp_path):
+    """Test that bulk page appending extracts exactly the requested range."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a PDF with 5 pages of distinct sizes so pages are identifiable
+    pdf_path = Path(input_dir) / "test.pdf"
+    writer = PdfWriter()
+    for i in range(5):
+        writer.add_blank_page(width=612, height=700 + i)
+    buf = BytesIO()
+    writer.write(buf)
+    pdf_path.write_bytes(buf.getvalue())
+
+    organizer = DocumentOrganizer(Path(output_dir))
+    result = organizer.organize_document(
+        source_pdf_path=str(pdf_path),
+        start_page=2,
+        end_page=4,
+        document_type="Other"
+    )
+
+    with open(result.output_path, 'rb') as f:
+        output_reader = PdfReader(f)
+        assert len(output_reader.pages) == 3
+        heights = [float(page.mediabox.height) for page in output_reader.pages]
+        assert heights == [701.0, 702.0, 703.0]
+
+def test_organize_all_parallel(tmp_path):
+    """Test organizing multiple documents with parallel writes."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
+
+    organizer = DocumentOrganizer(Path(output_dir))
+
+    results = organizer.organize_all([
+        (str(pdf_path), 1, 1, "Important Documents", "doc.pdf"),
+        (str(pdf_path), 2, 2, "Important Documents", "doc.pdf"),
+        (str(pdf_path), 3, 3, "Other", None),
+    ], max_workers=2)
+
+    assert len(results) == 3
+    # Duplicate suggested filenames within the batch are uniquified
+    assert results[0].filename == "doc.pdf"
+    assert results[1].filename == "doc_1.pdf"
+    assert results[2].filename == "test_pages_3-3.pdf"
+    for result in results:
+        assert Path(result.output_path).exists()
+    assert len(organizer.metadata) == 3
+
+def test_organize_all_dry_run(tmp_path):
+    """Test that organize_all creates no files in dry-run mode."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
+
+    organizer = DocumentOrganizer(Path(output_dir))
+
+    results = organizer.organize_all([
+        (str(pdf_path), 1, 3, "Important Documents", None),
+    ], dry_run=True)
+
+    assert len(results) == 1
+    assert not any(Path(output_dir).glob("**/*.pdf"))
+
+def test_save_metadata(tmp_path):
+    """Test saving metadata, verifying via the fast JSON mirror."""
+    temp_dir = tmp_path
+    organizer = DocumentOrganizer(Path(temp_dir))
+    metadata = DocumentMetadata(
+        source_pdf="test.pdf",
+        start_page=1,
+        end_page=3,
+        document_type="Important Documents",
+        filename="will.pdf",
+        confidence=0.95,
+        output_path="output/Important Documents/will.pdf"
+    )
         
-        organizer.add_document(metadata)
-        
-        # Save metadata
-        metadata_path = Path(temp_dir) / "metadata.yaml"
-        organizer.save_metadata(metadata_path)
-        
-        # Verify metadata file was created
-        assert metadata_path.exists()
+    organizer.add_document(metadata)
         
-        # Load and verify metadata
-        with open(metadata_path) as f:
-            loaded_metadata = yaml.safe_load(f)
+    # Save metadata
+    metadata_path = Path(temp_dir) / "metadata.yaml"
+    organizer.save_metadata(metadata_path)
         
-        assert "documents" in loaded_metadata
-        assert len(loaded_metadata["documents"]) == 1
-        doc = loaded_metadata["documents"][0]
-        assert doc["source_pdf"] == metadata.source_pdf
-        assert doc["start_page"] == metadata.start_page
-        assert doc["end_page"] == metadata.end_page
-        assert doc["document_type"] == metadata.document_type
-        assert doc["filename"] == metadata.filename
-        assert doc["confidence"] == metadata.confidence
-        assert doc["output_path"] == metadata.output_path
-
-def test_organize_document_invalid_page_range():
+    # Verify metadata file was created
+    assert metadata_path.exists()
+
+    # Load and verify metadata via the JSON mirror (orjson is much faster
+    # than PyYAML's pure-Python loader; the YAML itself is covered below)
+    loaded_metadata = orjson.loads((Path(temp_dir) / "metadata.json").read_bytes())
+
+    assert "documents" in loaded_metadata
+    assert len(loaded_metadata["documents"]) == 1
+    doc = loaded_metadata["documents"][0]
+    assert doc["source_pdf"] == metadata.source_pdf
+    assert doc["start_page"] == metadata.start_page
+    assert doc["end_page"] == metadata.end_page
+    assert doc["document_type"] == metadata.document_type
+    assert doc["filename"] == metadata.filename
+    assert doc["confidence"] == metadata.confidence
+    assert doc["output_path"] == metadata.output_path
+
+def test_append_metadata_jsonl_log(tmp_path):
+    """Test that organizing documents appends one JSONL line per document."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(4))
+
+    organizer = DocumentOrganizer(Path(output_dir))
+    organizer.organize_document(str(pdf_path), 1, 2, "Will")
+    organizer.organize_document(str(pdf_path), 3, 4, "Deed")
+
+    log_path = Path(output_dir) / "metadata.jsonl"
+    lines = log_path.read_bytes().splitlines()
+    assert len(lines) == 2
+    records = [orjson.loads(line) for line in lines]
+    assert records[0]["document_type"] == "Will"
+    assert records[1]["start_page"] == 3
+
+def test_unprocessed_pages_round_trip(tmp_path):
+    """Test that unprocessed pages survive the bitmask round trip."""
+    temp_dir = tmp_path
+    organizer = DocumentOrganizer(Path(temp_dir))
+    organizer.add_unprocessed_pages("test.pdf", [3, 1, 7, 100])
+
+    metadata_path = Path(temp_dir) / "metadata.yaml"
+    organizer.save_metadata(metadata_path)
+
+    with open(metadata_path) as f:
+        loaded = yaml.load(f, Loader=SafeLoader)
+
+    assert loaded["unprocessed_pages"]["test.pdf"] == [1, 3, 7, 100]
+
+def test_save_metadata_json_mirror(tmp_path):
+    """Test that save_metadata also writes a JSON mirror."""
+    temp_dir = tmp_path
+    organizer = DocumentOrganizer(Path(temp_dir))
+    organizer.add_document(DocumentMetadata(
+        source_pdf="test.pdf",
+        start_page=1,
+        end_page=3,
+        document_type="Important Documents",
+        filename="will.pdf",
+        confidence=0.95
+    ))
+
+    metadata_path = Path(temp_dir) / "metadata.yaml"
+    organizer.save_metadata(metadata_path)
+
+    json_path = Path(temp_dir) / "metadata.json"
+    assert json_path.exists()
+    loaded = orjson.loads(json_path.read_bytes())
+    assert len(loaded["documents"]) == 1
+    assert loaded["documents"][0]["filename"] == "will.pdf"
+
+def test_organize_document_invalid_page_range(tmp_path):
     """Test organizing a document with invalid page ranges."""
-    with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
-        # Create a simple PDF file with 3 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        writer = PdfWriter()
-        for i in range(3):
-            writer.add_blank_page(width=612, height=792)  # Standard letter size
-        with open(pdf_path, 'wb') as f:
-            writer.write(f)
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
         
-        # Open the PDF for reading
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PdfReader(f)
-            
-            organizer = DocumentOrganizer(Path(output_dir))
-            document_type = "Important Documents"
+    # Open the PDF for reading
+    with open(pdf_path, 'rb') as f:
+        pdf_reader = PdfReader(f)
             
-            # Test start page < 1
-            try:
-                organizer.organize_document(
-                    pdf_reader=pdf_reader,
-                    source_pdf_path=str(pdf_path),
-                    start_page=0,
-                    end_page=3,
-                    document_type=document_type
-                )
-                assert False, "Expected ValueError for start_page < 1"
-            except ValueError:
-                pass
-            
-            # Test end page > total pages
-            try:
-                organizer.organize_document(
-                    pdf_reader=pdf_reader,
-                    source_pdf_path=str(pdf_path),
-                    start_page=1,
-                    end_page=4,
-                    document_type=document_type
-                )
-                assert False, "Expected ValueError for end_page > total pages"
-            except ValueError:
-                pass
-            
-            # Test start page > end page
-            try:
-                organizer.organize_document(
-                    pdf_reader=pdf_reader,
-                    source_pdf_path=str(pdf_path),
-                    start_page=3,
-                    end_page=1,
-                    document_type=document_type
-                )
-                assert False, "Expected ValueError for start_page > end_page"
-            except ValueError:
-                pass
-
-def test_organize_document_with_existing_output():
-    """Test organizing a document when output file already exists."""
-    with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
-        # Create a simple PDF file with 3 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        writer = PdfWriter()
-        for i in range(3):
-            writer.add_blank_page(width=612, height=792)  # Standard letter size
-        with open(pdf_path, 'wb') as f:
-            writer.write(f)
-        
-        # Create output directory and file
+        organizer = DocumentOrganizer(Path(output_dir))
         document_type = "Important Documents"
-        output_dir_path = Path(output_dir) / document_type
-        output_dir_path.mkdir(parents=True)
-        output_path = output_dir_path / "test_pages_1-3.pdf"
-        with open(output_path, 'w') as f:
-            f.write("dummy file")
-        
-        # Open the PDF for reading
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PdfReader(f)
-            
-            organizer = DocumentOrganizer(Path(output_dir))
             
-            # Test with existing file - should create a new file with _1 suffix
-            result = organizer.organize_document(
+        # Test start page < 1
+        try:
+            organizer.organize_document(
                 pdf_reader=pdf_reader,
                 source_pdf_path=str(pdf_path),
-                start_page=1,
+                start_page=0,
                 end_page=3,
                 document_type=document_type
             )
+            assert False, "Expected ValueError for start_page < 1"
+        except ValueError:
+            pass
             
-            # Verify both files exist
-            assert output_path.exists()
-            assert Path(result.output_path).exists()
-            assert result.output_path != str(output_path)
-            assert result.filename == "test_pages_1-3_1.pdf"
-            
-            # Verify PDF content
-            with open(result.output_path, 'rb') as f:
-                output_reader = PdfReader(f)
-                assert len(output_reader.pages) == 3
-
-def test_organize_document_with_duplicate_filename():
-    """Test organizing a document with a duplicate filename."""
-    with tempfile.TemporaryDirectory() as input_dir, tempfile.TemporaryDirectory() as output_dir:
-        # Create a simple PDF file with 3 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        writer = PdfWriter()
-        for i in range(3):
-            writer.add_blank_page(width=612, height=792)  # Standard letter size
-        with open(pdf_path, 'wb') as f:
-            writer.write(f)
-        
-        # Open the PDF for reading
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PdfReader(f)
-            
-            organizer = DocumentOrganizer(Path(output_dir))
-            document_type = "Important Documents"
-            
-            # First document
+        # Test end page > total pages
+        try:
             organizer.organize_document(
                 pdf_reader=pdf_reader,
                 source_pdf_path=str(pdf_path),
                 start_page=1,
-                end_page=1,
-                document_type=document_type,
-                suggested_filename="test_doc.pdf"
+                end_page=4,
+                document_type=document_type
             )
+            assert False, "Expected ValueError for end_page > total pages"
+        except ValueError:
+            pass
             
-            # Second document with same suggested filename
+        # Test start page > end page
+        try:
             organizer.organize_document(
                 pdf_reader=pdf_reader,
                 source_pdf_path=str(pdf_path),
-                start_page=2,
-                end_page=2,
-                document_type=document_type,
-                suggested_filename="test_doc.pdf"
+                start_page=3,
+                end_page=1,
+                document_type=document_type
             )
+            assert False, "Expected ValueError for start_page > end_page"
+        except ValueError:
+            pass
+
+def test_organize_document_with_existing_output(tmp_path):
+    """Test organizing a document when output file already exists."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
+        
+    # Create output directory and file
+    document_type = "Important Documents"
+    output_dir_path = Path(output_dir) / document_type
+    output_dir_path.mkdir(parents=True)
+    output_path = output_dir_path / "test_pages_1-3.pdf"
+    with open(output_path, 'w') as f:
+        f.write("dummy file")
+        
+    # Open the PDF for reading
+    with open(pdf_path, 'rb') as f:
+        pdf_reader = PdfReader(f)
+            
+        organizer = DocumentOrganizer(Path(output_dir))
+            
+        # Test with existing file - should create a new file with _1 suffix
+        result = organizer.organize_document(
+            pdf_reader=pdf_reader,
+            source_pdf_path=str(pdf_path),
+            start_page=1,
+            end_page=3,
+            document_type=document_type
+        )
+            
+        # Verify both files exist
+        assert output_path.exists()
+        assert Path(result.output_path).exists()
+        assert result.output_path != str(output_path)
+        assert result.filename == "test_pages_1-3_1.pdf"
+            
+        # Verify PDF content
+        with pymupdf.open(result.output_path) as doc:
+            assert doc.page_count == 3
+
+def test_organize_document_with_duplicate_filename(tmp_path):
+    """Test organizing a document with a duplicate filename."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+    # Create a simple PDF file with 3 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
+        
+    # Open the PDF for reading
+    with open(pdf_path, 'rb') as f:
+        pdf_reader = PdfReader(f)
+            
+        organizer = DocumentOrganizer(Path(output_dir))
+        document_type = "Important Documents"
+            
+        # First document
+        organizer.organize_document(
+            pdf_reader=pdf_reader,
+            source_pdf_path=str(pdf_path),
+            start_page=1,
+            end_page=1,
+            document_type=document_type,
+            suggested_filename="test_doc.pdf"
+        )
+            
+        # Second document with same suggested filename
+        organizer.organize_document(
+            pdf_reader=pdf_reader,
+            source_pdf_path=str(pdf_path),
+            start_page=2,
+            end_page=2,
+            document_type=document_type,
+            suggested_filename="test_doc.pdf"
+        )
             
-            # Verify both files exist with correct names
-            assert (Path(output_dir) / document_type / "test_doc.pdf").exists()
-            assert (Path(output_dir) / document_type / "test_doc_1.pdf").exists()
+        # Verify both files exist with correct names
+        assert (Path(output_dir) / document_type / "test_doc.pdf").exists()
+        assert (Path(output_dir) / document_type / "test_doc_1.pdf").exists()
             
-            # Verify metadata
-            assert len(organizer.metadata) == 2
-            assert organizer.metadata[0].filename == "test_doc.pdf"
-            assert organizer.metadata[1].filename == "test_doc_1.pdf" 
\ No newline at end of file
+        # Verify metadata
+        assert len(organizer.metadata) == 2
+        assert organizer.metadata[0].filename == "test_doc.pdf"
+        assert organizer.metadata[1].filename == "test_doc_1.pdf" 
\ No newline at end of file
@@ -1,43 +1,87 @@
 """Tests for the PDF processor module."""
 
-import tempfile
+import bisect
+import re
+from collections import Counter
+from io import BytesIO
 from pathlib import Path
 
-import yaml
+from PIL import Image
+from pypdf import PdfWriter
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
 
-from estate_pdf_organizer.classifier import ClassificationResult
-from estate_pdf_organizer.processor import EstatePDFProcessor
+import estate_pdf_organizer.processor as processor_module
+from estate_pdf_organizer.classifier import ClassificationResult, DocumentClassifier
+from estate_pdf_organizer.processor import (
+    EstatePDFProcessor,
+    LazyPageImages,
+    binarize_for_ocr,
+    is_blank_page,
+    page_pixel_stddev,
+    text_layer_usable,
+)
 
+# Matches the leading "[PAGE N]" marker without splitting the whole window text
+_PAGE_RE = re.compile(r"\[PAGE (\d+)\]")
 
-class MockClassifier:
-    """Mock classifier for testing."""
+# Parsed taxonomy handed straight to MockClassifier; nothing in these tests
+# exercises the on-disk YAML loading path, so there is no file round trip
+TEST_TAXONOMY = {
+    "categories": [
+        "Will",
+        "Trust",
+        "Deed",
+        "Power of Attorney",
+        "Financial Statement",
+        "Tax Return",
+        "Insurance Policy",
+        "Other"
+    ]
+}
+
+
+class MockClassifier(DocumentClassifier):
+    """Mock classifier for testing.
+
+    Subclasses DocumentClassifier so it inherits the default classify_batch,
+    like any non-LLM classifier implementation would.
+    """
     
-    def __init__(self, taxonomy_path: Path):
+    def __init__(self, taxonomy: dict | None = None):
         """Initialize the mock classifier.
-        
+
         Args:
-            taxonomy_path: Path to taxonomy file (not used in mock)
+            taxonomy: Parsed taxonomy dictionary. Defaults to TEST_TAXONOMY.
         """
-        self._boundaries = [3, 5, 7]  # Default boundary pages
-    
+        self.taxonomy = taxonomy if taxonomy is not None else TEST_TAXONOMY
+        self.categories = self.taxonomy["categories"]
+        self._boundaries = [3, 5, 7]  # Default boundary pages, kept sorted
+
     @property
     def boundaries(self):
         return self._boundaries
-    
+
     @boundaries.setter
     def boundaries(self, value):
-        self._boundaries = value
+        self._boundaries = sorted(value)
     
     def classify(self, text: str) -> [ClassificationResult]:
         """Mock classification that returns boundaries at specific pages."""
         # Extract the current page number from the text
         # The text format is "[PAGE N]\n..." for each page
-        current_page = int(text.split('\n')[0].split(' ')[1].strip(']'))
+        current_page = int(_PAGE_RE.match(text).group(1))
         
         # If we're at a boundary page, return a document
-        if current_page in self._boundaries:
-            # Find the next boundary or end of window
-            next_boundary = min([b for b in self._boundaries if b > current_page], default=current_page + 1)
+        idx = bisect.bisect_left(self._boundaries, current_page)
+        if idx < len(self._boundaries) and self._boundaries[idx] == current_page:
+            # Find the next boundary or end of window; boundaries are sorted,
+            # so the one after current_page (if any) is at the next index
+            next_idx = idx + 1
+            if next_idx < len(self._boundaries):
+                next_boundary = self._boundaries[next_idx]
+            else:
+                next_boundary = current_page + 1
             return [ClassificationResult(
                 document_type="Will",
                 confidence=0.95,
@@ -58,143 +102,280 @@ class MockClassifier:
             # For non-boundary pages, return empty list
             return []
 
-def create_test_taxonomy(taxonomy_path: Path) -> None:
-    """Create a test taxonomy file.
-    
-    Args:
-        taxonomy_path: Path to create taxonomy file at
-    """
-    taxonomy = {
-        "categories": [
-            "Will",
-            "Trust",
-            "Deed",
-            "Power of Attorney",
-            "Financial Statement",
-            "Tax Return",
-            "Insurance Policy",
-            "Other"
-        ]
-    }
-    
-    with open(taxonomy_path, 'w') as f:
-        yaml.dump(taxonomy, f)
+# Generated fixture PDFs are deterministic per page count, so build each one
+# once and copy the bytes into every test's temporary directory
+_test_pdf_cache: dict[int, bytes] = {}
 
 def create_test_pdf(pdf_path: Path, num_pages: int) -> None:
     """Create a test PDF file with the specified number of pages.
-    
+
     Args:
         pdf_path: Path to create PDF file at
         num_pages: Number of pages to create
     """
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfgen import canvas
-    
+    pdf_bytes = _test_pdf_cache.get(num_pages)
+    if pdf_bytes is None:
+        writer = PdfWriter()
+        for _ in range(num_pages):
+            writer.add_blank_page(width=612, height=792)  # Standard letter size
+
+        buffer = BytesIO()
+        writer.write(buffer)
+        pdf_bytes = _test_pdf_cache[num_pages] = buffer.getvalue()
+
+    pdf_path.write_bytes(pdf_bytes)
+
+def test_is_blank_page():
+    """Test blank-page detection on extracted text."""
+    assert is_blank_page("")
+    assert is_blank_page("   \n\t  ")
+    assert is_blank_page(". _ -- | ...")
+    assert not is_blank_page("Last Will and Testament")
+    assert not is_blank_page("  \n page 3 of 10 ")
+
+def test_page_pixel_stddev():
+    """Test pixel-variance blank detection on synthetic page images."""
+    blank = Image.new("RGB", (200, 300), "white")
+    assert page_pixel_stddev(blank) < 3.0
+
+    inked = Image.new("RGB", (200, 300), "white")
+    for x in range(0, 200, 2):
+        for y in range(100, 200):
+            inked.putpixel((x, y), (0, 0, 0))
+    assert page_pixel_stddev(inked) > 8.0
+
+def test_binarize_for_ocr():
+    """Test pre-OCR binarization and its low-contrast fallback."""
+    # High-contrast page binarizes to 1-bit
+    page = Image.new("RGB", (100, 100), "white")
+    for x in range(40, 60):
+        for y in range(40, 60):
+            page.putpixel((x, y), (0, 0, 0))
+    assert binarize_for_ocr(page).mode == "1"
+
+    # Near-uniform low-contrast page stays grayscale
+    faint = Image.new("RGB", (100, 100), (200, 200, 200))
+    assert binarize_for_ocr(faint).mode == "L"
+
+def test_text_layer_usable():
+    """Test the embedded-text-layer heuristic that gates OCR."""
+    assert text_layer_usable(
+        "This Last Will and Testament is made by John Smith of Springfield."
+    )
+    assert not text_layer_usable(None)
+    assert not text_layer_usable("")
+    assert not text_layer_usable("page 3")  # Too short to trust
+    assert not text_layer_usable(".. -- || .. -- || .. -- || .. -- || .. -- || ..")
+
+def test_lazy_page_images_renders_on_demand(tmp_path):
+    """Test that LazyPageImages exposes pages without eager rasterization."""
+    temp_dir = tmp_path
+    pdf_path = Path(temp_dir) / "test.pdf"
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=612, height=792)
+    buf = BytesIO()
+    writer.write(buf)
+    pdf_path.write_bytes(buf.getvalue())
+
+    images = LazyPageImages(pdf_path)
+    assert len(images) == 3
+
+    page = images[0]
+    assert page.width > 0 and page.height > 0
+    # Negative indexing and bounds checking behave like a list
+    assert images[-1].size == images[2].size
+    try:
+        images[3]
+        raise AssertionError("Expected IndexError for out-of-range page")
+    except IndexError:
+        pass
+
+def test_digital_pdf_skips_rendering_and_ocr(tmp_path):
+    """Test that a born-digital PDF is read from its text layer without OCR."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+
+    pdf_path = Path(input_dir) / "digital.pdf"
     c = canvas.Canvas(str(pdf_path), pagesize=letter)
-    width, height = letter
-    
-    for i in range(num_pages):
-        c.drawString(100, height - 100, f"Test Page {i + 1}")
+    for i in range(3):
+        c.drawString(72, 720, f"This Last Will and Testament, page {i + 1},")
+        c.drawString(72, 700, "is made and declared by John Smith of Springfield.")
         c.showPage()
-    
     c.save()
 
-def test_process_pdf():
+    processor = EstatePDFProcessor(
+        input_dir=Path(input_dir),
+        output_dir=Path(output_dir),
+        classifier=MockClassifier(),
+    )
+
+    images = LazyPageImages(pdf_path)
+    assert processor._pages_needing_ocr(images) == []
+    # All three pages were served from the embedded text layer
+    assert sorted(processor._ocr_cache) == [1, 2, 3]
+    assert "John Smith" in processor._ocr_cache[1]
+
+def test_overlapping_windows_ocr_each_page_once(tmp_path):
+    """Test that overlapping window text requests OCR each page at most once."""
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+
+    processor = EstatePDFProcessor(
+        input_dir=Path(input_dir),
+        output_dir=Path(output_dir),
+        classifier=MockClassifier(),
+        ocr_workers=1
+    )
+
+    calls = []
+    original = processor_module.extract_text_from_page
+    processor_module.extract_text_from_page = lambda image: calls.append(image) or "text"
+    try:
+        images = ["img1", "img2", "img3", "img4", "img5"]
+        processor._window_text(images, 1, 3)
+        processor._window_text(images, 2, 4)
+        processor._window_text(images, 1, 3)
+        processor._window_text(images, 3, 5)
+    finally:
+        processor_module.extract_text_from_page = original
+
+    # Pages 1-5 each OCR'd exactly once despite overlapping windows
+    assert len(calls) == 5
+    assert len(set(calls)) == 5
+
+def test_process_pdf_batch_mode(tmp_path):
+    """Test batch mode with a classifier that only implements classify."""
+    import estate_pdf_organizer.processor as processor_module
+
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+
+    pdf_path = Path(input_dir) / "test.pdf"
+    create_test_pdf(pdf_path, num_pages=10)
+
+    processor = EstatePDFProcessor(
+        input_dir=Path(input_dir),
+        output_dir=Path(output_dir),
+        classifier=MockClassifier(),
+        dry_run=True,
+        window_size=3,
+        use_batch_api=True,
+        ocr_workers=1
+    )
+
+    original = processor_module.extract_text_from_page
+    processor_module.extract_text_from_page = lambda image: "scanned page text"
+    try:
+        results = processor.process_pdf(pdf_path)
+    finally:
+        processor_module.extract_text_from_page = original
+
+    # Windows 1-3 and 7-9 start on boundary pages; the rest go unorganized.
+    # The mock has no classify_with_batch_api, so this exercises the
+    # DocumentClassifier.classify_batch fallback.
+    counts = Counter(r.document_type for r in results)
+    assert counts["Will"] == 2
+    assert counts["Unorganized"] >= 1
+
+def test_process_pdf(tmp_path):
     """Test processing a single PDF file."""
-    with tempfile.TemporaryDirectory() as input_dir, \
-         tempfile.TemporaryDirectory() as output_dir, \
-         tempfile.TemporaryDirectory() as taxonomy_dir:
-        
-        # Create a test taxonomy file
-        taxonomy_path = Path(taxonomy_dir) / "taxonomy.yaml"
-        create_test_taxonomy(taxonomy_path)
-        
-        # Create a test PDF with 10 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        create_test_pdf(pdf_path, num_pages=10)
-        
-        # Create a mock classifier
-        mock_classifier = MockClassifier(taxonomy_path)
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+
+    # Create a test PDF with 10 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    create_test_pdf(pdf_path, num_pages=10)
         
-        # Test dry run mode
-        processor = EstatePDFProcessor(
-            input_dir=Path(input_dir),
-            output_dir=Path(output_dir),
-            classifier=mock_classifier,
-            overwrite=True,
-            dry_run=True,
-            window_size=3
-        )
+    # Create a mock classifier
+    mock_classifier = MockClassifier()
         
-        processor.process_pdf(pdf_path)
+    # Test dry run mode
+    processor = EstatePDFProcessor(
+        input_dir=Path(input_dir),
+        output_dir=Path(output_dir),
+        classifier=mock_classifier,
+        overwrite=True,
+        dry_run=True,
+        window_size=3
+    )
         
-        # Verify that no files were created in dry run mode
-        assert len(list(Path(output_dir).glob("**/*.pdf"))) == 0
+    results = processor.process_pdf(pdf_path)
 
-def test_process_directory():
+    # Verify that documents were planned but none were written; checking
+    # the returned paths directly avoids walking the whole output tree
+    assert len(results) > 0
+    assert not any(Path(r.output_path).exists() for r in results)
+
+def test_process_directory(tmp_path):
     """Test processing a directory of PDFs."""
-    with tempfile.TemporaryDirectory() as input_dir, \
-         tempfile.TemporaryDirectory() as output_dir, \
-         tempfile.TemporaryDirectory() as taxonomy_dir:
-        
-        # Create a test taxonomy file
-        taxonomy_path = Path(taxonomy_dir) / "taxonomy.yaml"
-        create_test_taxonomy(taxonomy_path)
-        
-        # Create two test PDFs
-        for i in range(2):
-            pdf_path = Path(input_dir) / f"test_{i}.pdf"
-            create_test_pdf(pdf_path, num_pages=10)
-        
-        # Create a mock classifier
-        mock_classifier = MockClassifier(taxonomy_path)
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+
+    # Create two test PDFs
+    for i in range(2):
+        pdf_path = Path(input_dir) / f"test_{i}.pdf"
+        create_test_pdf(pdf_path, num_pages=10)
         
-        # Test dry run mode
-        processor = EstatePDFProcessor(
-            input_dir=Path(input_dir),
-            output_dir=Path(output_dir),
-            classifier=mock_classifier,
-            overwrite=True,
-            dry_run=True,
-            window_size=3
-        )
+    # Create a mock classifier
+    mock_classifier = MockClassifier()
         
-        processor.process_directory()
+    # Test dry run mode
+    processor = EstatePDFProcessor(
+        input_dir=Path(input_dir),
+        output_dir=Path(output_dir),
+        classifier=mock_classifier,
+        overwrite=True,
+        dry_run=True,
+        window_size=3
+    )
         
-        # Verify that no files were created in dry run mode
-        assert len(list(Path(output_dir).glob("**/*.pdf"))) == 0
+    results = processor.process_directory()
 
-def test_multiple_documents_per_window():
+    # Verify that documents were planned but none were written; checking
+    # the returned paths directly avoids walking the whole output tree
+    assert len(results) > 0
+    assert not any(Path(r.output_path).exists() for r in results)
+
+def test_multiple_documents_per_window(tmp_path):
     """Test handling multiple documents within a single window."""
-    with tempfile.TemporaryDirectory() as input_dir, \
-         tempfile.TemporaryDirectory() as output_dir, \
-         tempfile.TemporaryDirectory() as taxonomy_dir:
-        
-        # Create a test taxonomy file
-        taxonomy_path = Path(taxonomy_dir) / "taxonomy.yaml"
-        create_test_taxonomy(taxonomy_path)
-        
-        # Create a test PDF with 10 pages
-        pdf_path = Path(input_dir) / "test.pdf"
-        create_test_pdf(pdf_path, num_pages=10)
-        
-        # Create a mock classifier that returns boundaries at pages 3, 5, and 7
-        mock_classifier = MockClassifier(taxonomy_path)
-        mock_classifier.boundaries = [3, 5, 7]
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for d in (input_dir, output_dir):
+        d.mkdir()
+
+    # Create a test PDF with 10 pages
+    pdf_path = Path(input_dir) / "test.pdf"
+    create_test_pdf(pdf_path, num_pages=10)
         
-        processor = EstatePDFProcessor(
-            input_dir=Path(input_dir),
-            output_dir=Path(output_dir),
-            classifier=mock_classifier,
-            overwrite=True,
-            dry_run=False,
-            window_size=3
-        )
+    # Create a mock classifier that returns boundaries at pages 3, 5, and 7
+    mock_classifier = MockClassifier()
+    mock_classifier.boundaries = [3, 5, 7]
         
-        processor.process_pdf(pdf_path)
+    processor = EstatePDFProcessor(
+        input_dir=Path(input_dir),
+        output_dir=Path(output_dir),
+        classifier=mock_classifier,
+        overwrite=True,
+        dry_run=False,
+        window_size=3
+    )
         
-        # Verify that the correct number of documents were created
-        will_files = list(Path(output_dir).glob("Will/*.pdf"))
-        unorganized_files = list(Path(output_dir).glob("Unorganized/*.pdf"))
-        assert len(will_files) == 4  # Documents ending at pages 1-2, 3, 5, and 7
-        assert len(unorganized_files) == 1  # Remaining pages 8-10 
\ No newline at end of file
+    results = processor.process_pdf(pdf_path)
+
+    # Verify that the correct number of documents were created, counting
+    # the returned metadata instead of walking the output tree
+    counts = Counter(r.document_type for r in results)
+    assert counts["Will"] == 4  # Documents ending at pages 1-2, 3, 5, and 7
+    assert counts["Unorganized"] == 1  # Remaining pages 8-10
+    assert all(Path(r.output_path).exists() for r in results) 
\ No newline at end of file